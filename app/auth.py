@@ -1,4 +1,8 @@
+import asyncio
 import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 from fastapi import Depends, HTTPException, status
@@ -7,18 +11,65 @@ from jose import JWTError, jwt
 from jwt.exceptions import InvalidTokenError
 from passlib.context import CryptContext
 
+from app.cache import TTLCache
+
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = "HS256"
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=int(os.getenv("BCRYPT_ROUNDS", "12")),
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# bcrypt releases the GIL, so hashing runs in parallel on these threads
+# while the event loop keeps serving other requests. Work beyond
+# PASSWORD_HASH_MAX_PENDING jobs (running plus queued) is refused with 503
+# instead of queueing without bound.
+PASSWORD_HASH_WORKERS = int(
+    os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+password_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+password_slots = threading.BoundedSemaphore(
+    int(os.getenv("PASSWORD_HASH_MAX_PENDING", str(PASSWORD_HASH_WORKERS * 8)))
+)
+
+CurrentBank = namedtuple("CurrentBank", ["id", "name", "active"])
+
+# Identity of authenticated banks, checked after the JWT is validated.
+# update_bank and delete_bank invalidate entries explicitly.
+bank_cache = TTLCache(
+    max_size=int(os.getenv("BANK_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("BANK_CACHE_TTL", "30")),
+)
+
+
+async def run_password_job(function, *args):
+    if not password_slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many password checks in progress, please retry.",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        future = password_executor.submit(function, *args)
+    except BaseException:
+        password_slots.release()
+        raise
+    # The slot is held until the job itself finishes, even if the request
+    # that started it is cancelled.
+    future.add_done_callback(lambda _: password_slots.release())
+    return await asyncio.wrap_future(future)
+
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+async def get_password_hash(password: str) -> str:
+    return await run_password_job(pwd_context.hash, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await run_password_job(pwd_context.verify, plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
@@ -0,0 +1,65 @@
+import hashlib
+import os
+import tempfile
+from contextlib import suppress
+
+BLOB_CHUNK_SIZE = 1024 * 1024
+
+
+class BlobStore:
+    """Files on local disk, stored once under the SHA-256 of their content.
+
+    Uploads are copied ``BLOB_CHUNK_SIZE`` bytes at a time into a temporary
+    file in the store and hashed on the way, then renamed into place, so a
+    blob path never holds a partial file and memory use does not depend on
+    the upload size. Identical uploads share one file.
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    def path(self, digest):
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def save(self, file):
+        """Store the readable binary ``file``; returns ``(sha256, size)``."""
+        os.makedirs(self.root, exist_ok=True)
+        digest, size = hashlib.sha256(), 0
+        handle, temp_path = tempfile.mkstemp(dir=self.root, prefix=".upload-")
+        try:
+            with os.fdopen(handle, "wb") as temp_file:
+                while chunk := file.read(BLOB_CHUNK_SIZE):
+                    digest.update(chunk)
+                    temp_file.write(chunk)
+                    size += len(chunk)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            path = self.path(digest.hexdigest())
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(temp_path, path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(temp_path)
+            raise
+        return digest.hexdigest(), size
+
+    def iter_range(self, digest, start, length):
+        """Yield ``length`` bytes of a blob from offset ``start`` in chunks."""
+        with open(self.path(digest), "rb") as file:
+            file.seek(start)
+            while length > 0:
+                chunk = file.read(min(BLOB_CHUNK_SIZE, length))
+                if not chunk:
+                    return
+                length -= len(chunk)
+                yield chunk
+
+    def exists(self, digest):
+        return os.path.isfile(self.path(digest))
+
+    def delete(self, digest):
+        with suppress(FileNotFoundError):
+            os.remove(self.path(digest))
+
+
+blob_store = BlobStore(os.getenv("BLOB_STORE_DIR", "blobs"))
@@ -0,0 +1,93 @@
+import csv
+import io
+import json
+
+from pydantic import ValidationError
+
+from app.load_model import FEATURE_FIELDS
+
+DATASET_FIELDS = {column.strip(): field for column, field in FEATURE_FIELDS.items()}
+DATASET_COLUMNS = {field: column for column, field in DATASET_FIELDS.items()}
+CATEGORY_VALUES = {
+    "self_employed": {"No": False, "Yes": True},
+    "education": {"Not Graduate": False, "Graduate": True},
+    "loan_status": {"Rejected": False, "Approved": True},
+}
+
+
+def iter_records(file, format):
+    """Yield ``(row_number, record)`` from a CSV or NDJSON upload.
+
+    The upload is decoded and parsed line by line, so it is never held in
+    memory as a whole. Column names and values are stripped, and a UTF-8
+    byte order mark is skipped, which lets ``loan_approval_dataset.csv``
+    (or a spreadsheet export of it) be uploaded as is. Lines that cannot
+    be parsed are yielded as ValueError records; if the file itself stops
+    being readable, that error is yielded for the next row and the upload
+    is not read any further.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    row_number = 0
+    try:
+        if format == "csv":
+            reader = csv.reader(text)
+            header = [name.strip() for name in next(reader, [])]
+            for row_number, row in enumerate(reader, start=1):
+                yield row_number, dict(
+                    zip(header, (value.strip() for value in row))
+                )
+            return
+        for row_number, line in enumerate(text, start=1):
+            if line.strip():
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    record = ValueError(f"Invalid JSON: {exc.msg}")
+                yield row_number, record
+    except UnicodeDecodeError:
+        yield row_number + 1, ValueError(
+            "File is not valid UTF-8; the rest of the upload was not read"
+        )
+    except csv.Error as exc:
+        yield row_number + 1, ValueError(
+            f"Invalid CSV: {exc}; the rest of the upload was not read"
+        )
+
+
+def record_to_customer(record, customer_model):
+    """Map a dataset-layout record onto ``customer_model`` field values.
+
+    Raises ValueError with a readable message for rows that cannot be
+    imported.
+    """
+    if isinstance(record, ValueError):
+        raise record
+    if not isinstance(record, dict):
+        raise ValueError("Each line must be a JSON object")
+    record = {
+        name.strip(): value.strip() if isinstance(value, str) else value
+        for name, value in record.items()
+    }
+    for column, values in CATEGORY_VALUES.items():
+        value = record.get(column)
+        if isinstance(value, str) and value in values:
+            record[column] = values[value]
+        elif value == "":
+            record[column] = None
+    data = {
+        field: record[column]
+        for column, field in DATASET_FIELDS.items()
+        if record.get(column) is not None
+    }
+    data["name"] = record.get("name") or str(record.get("loan_id") or "")
+    data["approval_status"] = record.get("loan_status")
+    try:
+        return customer_model(**data).model_dump()
+    except ValidationError as exc:
+        raise ValueError(
+            "; ".join(
+                f"{DATASET_COLUMNS.get(error['loc'][0], error['loc'][0])}: "
+                f"{error['msg']}"
+                for error in exc.errors()
+            )
+        )
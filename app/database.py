@@ -1,22 +1,123 @@
 import os
+from contextlib import contextmanager
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.pool_metrics import PoolMetrics, timed_pool_class
 
 load_dotenv()
 
 DB_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DB_URL)
+# Async drivers used for the routers when ASYNC_DATABASE_URL is not given.
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(url):
+    url = make_url(url)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername))
+
+
+ASYNC_DB_URL = os.getenv("ASYNC_DATABASE_URL") or async_database_url(DB_URL)
+
+
+def pool_options(url, pool_class, metrics):
+    """Engine keyword arguments for a ``pool_class`` sized from the environment.
+
+    Each engine gets its own queue pool, so the sync and async engines are
+    sized independently of each other by the same variables. In-memory
+    SQLite keeps the dialect's default pool because it must not hand out
+    separate connections.
+    """
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": timed_pool_class(pool_class, metrics),
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower()
+        in ("1", "true", "yes"),
+    }
+
+
+pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
+engine = create_engine(DB_URL, **pool_options(DB_URL, QueuePool, pool_metrics))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async_engine = create_async_engine(
+    ASYNC_DB_URL,
+    **pool_options(ASYNC_DB_URL, AsyncAdaptedQueuePool, async_pool_metrics),
+)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
 Base = declarative_base()
 
 
+def pool_status():
+    return {
+        "async": async_pool_metrics.snapshot(async_engine.pool),
+        "sync": pool_metrics.snapshot(engine.pool),
+    }
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+@contextmanager
+def count_queries(*binds):
+    """Collect the SQL statements run on ``binds`` (default: both engines).
+
+    Yields the list the statements are appended to, for tests that pin how
+    many queries an endpoint may issue.
+    """
+    targets = [getattr(bind, "sync_engine", bind) for bind in binds] or [
+        engine,
+        async_engine.sync_engine,
+    ]
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    for target in targets:
+        event.listen(target, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        for target in targets:
+            event.remove(target, "before_cursor_execute", record)
+
+
+@contextmanager
+def assert_max_queries(limit, *binds):
+    with count_queries(*binds) as statements:
+        yield statements
+    if len(statements) > limit:
+        raise AssertionError(
+            f"{len(statements)} queries ran, expected at most {limit}:\n"
+            + "\n".join(statements)
+        )
@@ -0,0 +1,223 @@
+import hashlib
+import json
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+# File layout: magic, little-endian uint64 header length, JSON header, then
+# each node array at an ARRAY_ALIGNMENT boundary. Offsets in the header are
+# relative to the first aligned byte after the header.
+MODEL_MAGIC = b"FLATFRST"
+FORMAT_VERSION = 1
+ARRAY_ALIGNMENT = 64
+NODE_ARRAYS = ("feature", "threshold", "left", "right", "value", "roots")
+
+
+class FlatForest:
+    """A trained RandomForest flattened into parallel NumPy node arrays.
+
+    Node ``i`` splits on ``feature[i]`` at ``threshold[i]`` and continues
+    at ``left[i]`` or ``right[i]``; children are stored next to each other,
+    so ``right[i] == left[i] + 1``. Leaves point back to themselves with an
+    infinite threshold, so a pair that reached a leaf stays put. A batch is
+    evaluated level by level over all (row, tree) pairs at once, compacting
+    the working set once most pairs have settled.
+    """
+
+    def __init__(self, feature, threshold, left, right, value, roots, classes, depth):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.classes = classes
+        self.depth = depth
+
+    def predict(self, X):
+        return self.classes[majority_vote(self.tree_votes(X), len(self.classes))]
+
+    def tree_votes(self, X):
+        """Class index every tree predicts for every row, shape (rows, trees)."""
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+        n_rows, n_trees = len(X), len(self.roots)
+        values = X.ravel()
+        leaves = np.empty(n_rows * n_trees, dtype=np.int32)
+        pairs = np.arange(n_rows * n_trees, dtype=np.int32)
+        offsets = np.repeat(np.arange(n_rows, dtype=np.intp) * X.shape[1], n_trees)
+        current = np.tile(self.roots, n_rows)
+        for _ in range(self.depth):
+            left = self.left[current]
+            is_split = left != current
+            n_split = np.count_nonzero(is_split)
+            if not n_split:
+                break
+            if n_split < len(current) // 2:
+                done, keep = np.flatnonzero(~is_split), np.flatnonzero(is_split)
+                leaves[pairs[done]] = current[done]
+                pairs, offsets = pairs[keep], offsets[keep]
+                current, left = current[keep], left[keep]
+            goes_right = (
+                values[offsets + self.feature[current]] > self.threshold[current]
+            )
+            current = left + goes_right
+        leaves[pairs] = current
+        return self.value[leaves].reshape(n_rows, n_trees)
+
+
+def majority_vote(votes, n_classes):
+    """Most common class per row, ties going to the earliest tree like Counter."""
+    rows = np.arange(len(votes))[:, np.newaxis]
+    counts = np.bincount(
+        (rows * n_classes + votes).ravel(), minlength=len(votes) * n_classes
+    ).reshape(len(votes), n_classes)
+    is_majority = counts[rows, votes] == counts.max(axis=1, keepdims=True)
+    return votes[rows[:, 0], np.argmax(is_majority, axis=1)]
+
+
+def compile_forest(forest):
+    """Flatten the nested-tuple trees of a trained RandomForest."""
+    leaf_labels = []
+    for tree in forest.trees:
+        stack = [tree.tree]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, tuple):
+                stack.extend(node[2:])
+            else:
+                leaf_labels.append(node)
+    classes = np.unique(np.asarray(leaf_labels))
+    feature, threshold, left, right, value, roots = [], [], [], [], [], []
+
+    def add_node():
+        feature.append(0)
+        threshold.append(np.inf)
+        left.append(len(left))
+        right.append(len(right))
+        value.append(0)
+        return len(feature) - 1
+
+    depth = 0
+    for tree in forest.trees:
+        roots.append(add_node())
+        stack = [(tree.tree, roots[-1], 0)]
+        while stack:
+            node, index, node_depth = stack.pop()
+            depth = max(depth, node_depth)
+            if not isinstance(node, tuple):
+                value[index] = int(np.searchsorted(classes, node))
+                continue
+            feature[index], threshold[index] = node[0], node[1]
+            left[index], right[index] = add_node(), add_node()
+            stack.append((node[2], left[index], node_depth + 1))
+            stack.append((node[3], right[index], node_depth + 1))
+    return FlatForest(
+        feature=np.asarray(feature, dtype=np.int32),
+        threshold=np.asarray(threshold, dtype=np.float64),
+        left=np.asarray(left, dtype=np.int32),
+        right=np.asarray(right, dtype=np.int32),
+        value=np.asarray(value, dtype=np.int32),
+        roots=np.asarray(roots, dtype=np.int32),
+        classes=classes,
+        depth=depth,
+    )
+
+
+def _aligned(offset):
+    return -(-offset // ARRAY_ALIGNMENT) * ARRAY_ALIGNMENT
+
+
+def save_flat_forest(forest, path, feature_names, metadata=None):
+    """Write ``forest`` as typed node arrays behind a small JSON header.
+
+    The file is written next to ``path`` and renamed over it, so a server
+    watching ``path`` never maps a half-written model. ``version`` in the
+    header is derived from the array contents.
+    """
+    # Node indices, feature indices and class codes are stored in the
+    # smallest unsigned type that holds them; thresholds stay float64 so
+    # predictions match the trained trees exactly.
+    n_nodes = len(forest.feature)
+    arrays = {}
+    for name in NODE_ARRAYS:
+        array = np.asarray(getattr(forest, name))
+        if name != "threshold":
+            largest = n_nodes if name in ("left", "right", "roots") else array.max()
+            array = array.astype(np.min_scalar_type(largest))
+        arrays[name] = np.ascontiguousarray(array)
+    digest = hashlib.sha256()
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        digest.update(array.tobytes())
+        layout[name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+        }
+        offset = _aligned(offset + array.nbytes)
+    header = json.dumps(
+        {
+            "format_version": FORMAT_VERSION,
+            "version": digest.hexdigest()[:12],
+            "feature_names": list(feature_names),
+            "classes": forest.classes.tolist(),
+            "depth": forest.depth,
+            "arrays": layout,
+            "metadata": metadata or {},
+        }
+    ).encode()
+    data_start = _aligned(len(MODEL_MAGIC) + 8 + len(header))
+    handle, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(MODEL_MAGIC + struct.pack("<Q", len(header)) + header)
+            for name, array in arrays.items():
+                file.seek(data_start + layout[name]["offset"])
+                file.write(array.tobytes())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def is_flat_forest_file(path):
+    with open(path, "rb") as file:
+        return file.read(len(MODEL_MAGIC)) == MODEL_MAGIC
+
+
+def load_flat_forest(path):
+    """Map a file written by ``save_flat_forest`` read-only into a FlatForest.
+
+    The node arrays are views of one shared ``numpy.memmap``, so every
+    process serving the same file reads the same page-cache pages instead
+    of holding a private copy. Returns the forest and the parsed header.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MODEL_MAGIC)) != MODEL_MAGIC:
+            raise ValueError(f"{path} is not a flat forest model file")
+        (header_length,) = struct.unpack("<Q", file.read(8))
+        header = json.loads(file.read(header_length))
+    if header["format_version"] != FORMAT_VERSION:
+        raise ValueError(
+            f"{path} has format version {header['format_version']}, "
+            f"expected {FORMAT_VERSION}"
+        )
+    data_start = _aligned(len(MODEL_MAGIC) + 8 + header_length)
+    pages = np.memmap(path, dtype=np.uint8, mode="r")
+    arrays = {}
+    for name in NODE_ARRAYS:
+        spec = header["arrays"][name]
+        dtype, shape = np.dtype(spec["dtype"]), tuple(spec["shape"])
+        start = data_start + spec["offset"]
+        end = start + dtype.itemsize * int(np.prod(shape))
+        arrays[name] = pages[start:end].view(dtype).reshape(shape)
+    forest = FlatForest(
+        classes=np.asarray(header["classes"]), depth=header["depth"], **arrays
+    )
+    return forest, header
@@ -1,27 +1,240 @@
+import hashlib
 import os
 import pickle
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
 
-import pandas as pd
+import numpy as np
 
-MODEL_PATH = os.getenv("MODEL_PATH")
+from app.cache import TTLCache
+from app.flat_forest import is_flat_forest_file, load_flat_forest
 
-with open(MODEL_PATH, "rb") as file:
-    model = pickle.load(file)
+FEATURE_FIELDS = {
+    " self_employed": "is_employed",
+    " income_annum": "income",
+    " loan_amount": "loan_amount",
+    " cibil_score": "credit_score",
+    " education": "is_graduated",
+    " loan_term": "loan_term",
+    " residential_assets_value": "residential_assets",
+    " commercial_assets_value": "commercial_assets",
+    " luxury_assets_value": "luxury_assets",
+    " bank_asset_value": "bank_assets",
+}
+FIELD_ORDER = tuple(FEATURE_FIELDS.values())
+
+
+class LoadedModel:
+    """One unpickled model file together with where and how it was loaded."""
+
+    def __init__(self, model, version, path, size_bytes, load_seconds):
+        self.model = model
+        self.version = version
+        self.path = path
+        self.size_bytes = size_bytes
+        self.load_seconds = load_seconds
+        self.loaded_at = datetime.now(timezone.utc)
+
+    def describe(self):
+        return {
+            "version": self.version,
+            "path": self.path,
+            "size_bytes": self.size_bytes,
+            "load_seconds": round(self.load_seconds, 4),
+            "loaded_at": self.loaded_at.isoformat(),
+        }
+
+
+def load_model_file(path):
+    started = time.perf_counter()
+    if is_flat_forest_file(path):
+        return load_flat_forest_file(path, started)
+    with open(path, "rb") as file:
+        content = file.read()
+    model = pickle.loads(content)
+    trained_feature_names = getattr(model, "feature_names_in_", None)
+    if trained_feature_names is not None:
+        check_feature_names(path, trained_feature_names)
+        # The column order is checked once here, so requests can pass plain
+        # arrays without sklearn re-validating names on every call.
+        del model.feature_names_in_
+    return LoadedModel(
+        model=model,
+        version=hashlib.sha256(content).hexdigest()[:12],
+        path=path,
+        size_bytes=len(content),
+        load_seconds=time.perf_counter() - started,
+    )
+
+
+def load_flat_forest_file(path, started):
+    """Memory-map a model exported by the trainer instead of unpickling it."""
+    forest, header = load_flat_forest(path)
+    check_feature_names(path, header["feature_names"])
+    return LoadedModel(
+        model=forest,
+        version=header["version"],
+        path=path,
+        size_bytes=os.path.getsize(path),
+        load_seconds=time.perf_counter() - started,
+    )
+
+
+def check_feature_names(path, trained_feature_names):
+    if list(trained_feature_names) != list(FEATURE_FIELDS):
+        raise ValueError(
+            f"Model at {path} was trained on features "
+            f"{list(trained_feature_names)}, expected {list(FEATURE_FIELDS)}"
+        )
+
+
+class ModelRegistry:
+    """Loads the model at ``path`` and swaps in new versions of it.
+
+    Only the very first load blocks a caller; ``start()`` lets the app begin
+    it at startup instead. After that the file is stat'ed at most every
+    ``check_interval`` seconds from a background thread and reloaded when
+    its mtime or size changes, while ``current()`` keeps returning the
+    previous model until the new one is ready. Callers hold on to the
+    LoadedModel they got, so requests already scoring finish on the old
+    version. A file that fails to load is reported and the previous model
+    is kept. ``status()`` lists the last ``history`` versions loaded.
+    """
+
+    def __init__(self, path, history=3, check_interval=1.0):
+        self.path = path
+        self.history = history
+        self.check_interval = check_interval
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._reloader_lock = threading.Lock()
+        self._reloader = None
+        self._versions = OrderedDict()
+        self._current = None
+        self._signature = None
+        self._next_check = 0.0
+
+    def current(self):
+        if self._current is None:
+            self._refresh()
+        elif time.monotonic() >= self._next_check:
+            self._refresh_in_background()
+        return self._current
+
+    def start(self):
+        if self.path:
+            self._refresh_in_background()
+
+    def _refresh_in_background(self):
+        with self._reloader_lock:
+            if self._reloader is not None and self._reloader.is_alive():
+                return
+            self._reloader = threading.Thread(
+                target=self._refresh_quietly, name="model-reloader", daemon=True
+            )
+            self._reloader.start()
+
+    def _refresh_quietly(self):
+        try:
+            self._refresh()
+        except Exception as exc:
+            self.last_error = f"{type(exc).__name__}: {exc}"
+
+    def _refresh(self):
+        if not self.path:
+            raise RuntimeError("MODEL_PATH is not set")
+        with self._lock:
+            now = time.monotonic()
+            if self._current is not None and now < self._next_check:
+                return
+            self._next_check = now + self.check_interval
+            try:
+                stat = os.stat(self.path)
+            except OSError as exc:
+                if self._current is None:
+                    raise
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                return
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if self._current is not None and signature == self._signature:
+                return
+            # Remember the file even if it is broken, so it is only retried
+            # once it changes again.
+            self._signature = signature
+            try:
+                loaded = load_model_file(self.path)
+            except Exception as exc:
+                if self._current is None:
+                    raise
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                return
+            self._versions.pop(loaded.version, None)
+            self._versions[loaded.version] = loaded
+            while len(self._versions) > self.history:
+                self._versions.popitem(last=False)
+            self._current = loaded
+            self.last_error = None
+
+    def status(self):
+        return {
+            "current": self._current.describe() if self._current else None,
+            "versions": [loaded.describe() for loaded in self._versions.values()],
+            "last_error": self.last_error,
+        }
+
+
+registry = ModelRegistry(
+    os.getenv("MODEL_PATH"),
+    history=int(os.getenv("MODEL_HISTORY", "3")),
+    check_interval=float(os.getenv("MODEL_RELOAD_INTERVAL", "1")),
+)
+
+
+prediction_cache = TTLCache(
+    max_size=int(os.getenv("PREDICTION_CACHE_SIZE", "4096")),
+    ttl=float(os.getenv("PREDICTION_CACHE_TTL", "300")),
+)
+
+
+def build_feature_matrix(customers):
+    """Lay customer dicts out as rows in the trained feature order."""
+    X = np.empty((len(customers), len(FIELD_ORDER)), dtype=np.float64)
+    for row, customer in enumerate(customers):
+        X[row] = [customer[field] for field in FIELD_ORDER]
+    return X
 
 
 def predict_approval_status(customer):
-    input_data = {
-        " self_employed": [customer["is_employed"]],
-        " income_annum": [customer["income"]],
-        " loan_amount": [customer["loan_amount"]],
-        " cibil_score": [customer["credit_score"]],
-        " education": [customer["is_graduated"]],
-        " loan_term": [customer["loan_term"]],
-        " residential_assets_value": [customer["residential_assets"]],
-        " commercial_assets_value": [customer["commercial_assets"]],
-        " luxury_assets_value": [customer["luxury_assets"]],
-        " bank_asset_value": [customer["bank_assets"]],
-    }
-    X_new = pd.DataFrame(input_data)
-    predictions = model.predict(X_new)
-    return bool(predictions[0])
+    return predict_approval_statuses([customer])[0]
+
+
+def predict_approval_statuses(customers, use_cache=True):
+    """Score many customers with a single model call, keeping input order.
+
+    Rows already in the prediction cache for the current model version are
+    answered from it; only the remaining rows reach the model. Keys are the
+    model version plus the ten features as floats, so equal customers hit
+    the same entry however their values were typed, and a swapped-in model
+    never reads results cached for another version. Bulk jobs pass
+    ``use_cache=False`` so they do not flush the cache.
+    """
+    loaded = registry.current()
+    if not use_cache:
+        predictions = loaded.model.predict(build_feature_matrix(customers))
+        return [bool(prediction) for prediction in predictions]
+    keys = [
+        (loaded.version, tuple(float(customer[field]) for field in FIELD_ORDER))
+        for customer in customers
+    ]
+    results = [prediction_cache.get(key) for key in keys]
+    missing = [row for row, result in enumerate(results) if result is None]
+    if missing:
+        predictions = loaded.model.predict(
+            build_feature_matrix([customers[row] for row in missing])
+        )
+        for row, prediction in zip(missing, predictions):
+            results[row] = bool(prediction)
+            prediction_cache.put(keys[row], results[row])
+    return results
@@ -1,6 +1,10 @@
-def loan_package_recommender(loan_packages, customer_data):
-    best_packages = []
-    assets_value = sum(
+from sqlalchemy import func, select
+
+from app.models import LoanPackage
+
+
+def customer_assets(customer_data):
+    return sum(
         [
             customer_data["residential_assets"],
             customer_data["commercial_assets"],
@@ -8,19 +12,27 @@ def loan_package_recommender(loan_packages, customer_data):
             customer_data["bank_assets"],
         ]
     )
-    eligible_packages = []
-    for package in loan_packages:
-        if (
-            customer_data["income"] >= package.min_income
-            and assets_value >= package.min_assets
-            and customer_data["credit_score"] >= package.min_credit_score
-        ):
-            loan_amount_distance = abs(
-                customer_data["loan_amount"] - package.loan_amount
-            )
-            loan_term_distance = abs(customer_data["loan_term"] - package.loan_term)
-            score = loan_amount_distance + loan_term_distance
-            eligible_packages.append((package, score))
-    eligible_packages.sort(key=lambda x: x[1])
-    best_packages = [package for package, score in eligible_packages]
-    return best_packages
+
+
+async def recommend_packages(db, bank_id, customer_data, limit):
+    """Eligible packages of a bank, closest first, filtered and ranked in SQL.
+
+    The minimum income/assets/credit score predicates run against the
+    ``ix_loan_package_bank_eligibility`` index and only ``limit`` rows are
+    returned, ordered by amount/term distance and then package id.
+    """
+    distance = func.abs(LoanPackage.loan_amount - customer_data["loan_amount"]) + (
+        func.abs(LoanPackage.loan_term - customer_data["loan_term"])
+    )
+    result = await db.execute(
+        select(LoanPackage)
+        .where(
+            LoanPackage.bank_id == bank_id,
+            LoanPackage.min_credit_score <= customer_data["credit_score"],
+            LoanPackage.min_income <= customer_data["income"],
+            LoanPackage.min_assets <= customer_assets(customer_data),
+        )
+        .order_by(distance, LoanPackage.id)
+        .limit(limit)
+    )
+    return result.scalars().all()
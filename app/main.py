@@ -6,6 +6,7 @@ from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.database import engine
+from app.load_model import registry
 from app.models import Base
 from app.routers import admin, bank, customer, package
 
@@ -21,6 +22,12 @@ app.add_middleware(
 
 Base.metadata.create_all(bind=engine)
 
+
+@app.on_event("startup")
+def load_model():
+    registry.start()
+
+
 app.include_router(admin.router)
 app.include_router(bank.router)
 app.include_router(customer.router)
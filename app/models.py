@@ -6,8 +6,8 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
-    LargeBinary,
     String,
 )
 from sqlalchemy.orm import relationship
@@ -23,10 +23,13 @@ class Bank(Base):
     activated_at = Column(DateTime)
     active = Column(Boolean)
     hashed_password = Column(String)
-    customers = relationship("Customer", back_populates="bank")
-    loan_package = relationship("LoanPackage", back_populates="bank")
+    # Related rows are never loaded implicitly; a query that needs them
+    # asks for them with selectinload, so a missing option fails loudly
+    # instead of issuing one query per bank.
+    customers = relationship("Customer", back_populates="bank", lazy="raise")
+    loan_package = relationship("LoanPackage", back_populates="bank", lazy="raise")
     proof_doc = relationship(
-        "BankRegistrationDocument", back_populates="bank", uselist=False
+        "BankRegistrationDocument", back_populates="bank", uselist=False, lazy="raise"
     )
 
 
@@ -34,11 +37,11 @@ class Customer(Base):
     __tablename__ = "customer"
 
     id = Column(Integer, primary_key=True, index=True)
-    created_at = Column(DateTime, default=datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(
         DateTime,
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
     )
     name = Column(String, index=True)
     is_employed = Column(Boolean)
@@ -70,12 +73,24 @@ class LoanPackage(Base):
     bank_id = Column(String, ForeignKey("bank.id"))
     bank = relationship("Bank", back_populates="loan_package")
 
+    __table_args__ = (
+        Index(
+            "ix_loan_package_bank_eligibility",
+            "bank_id",
+            "min_credit_score",
+            "min_income",
+            "min_assets",
+        ),
+    )
+
 
 class BankRegistrationDocument(Base):
-    __tablename__ = "files"
+    __tablename__ = "bank_document"
 
     id = Column(Integer, primary_key=True, index=True)
     filename = Column(String, index=True)
-    file_content = Column(LargeBinary)
+    content_type = Column(String)
+    size_bytes = Column(Integer)
+    sha256 = Column(String(64), index=True)
     bank_id = Column(String, ForeignKey("bank.id"))
     bank = relationship("Bank", back_populates="proof_doc")
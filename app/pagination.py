@@ -0,0 +1,45 @@
+from fastapi import HTTPException, status
+from sqlalchemy import select
+
+
+def parse_fields(model, fields):
+    """Turn a ``fields=a,b`` query value into column names of ``model``.
+
+    ``id`` is always included because it is the pagination cursor.
+    Returns None when no projection was requested.
+    """
+    if not fields:
+        return None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in model.__table__.columns]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}",
+        )
+    if "id" not in names:
+        names.insert(0, "id")
+    return names
+
+
+async def keyset_page(db, model, filters, after, limit, fields=None):
+    """Fetch one page of ``model`` rows with ids greater than ``after``.
+
+    Seeking on the primary key keeps every page as cheap as the first one.
+    Returns the rows (dicts when ``fields`` projects columns) and the
+    cursor for the next page, or None on the last page.
+    """
+    names = parse_fields(model, fields)
+    columns = [getattr(model, name) for name in names] if names else [model]
+    query = select(*columns).where(*filters)
+    if after is not None:
+        query = query.where(model.id > after)
+    result = await db.execute(query.order_by(model.id).limit(limit + 1))
+    rows = result.all() if names else result.scalars().all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1].id
+    if names:
+        rows = [row._asdict() for row in rows]
+    return rows, next_cursor
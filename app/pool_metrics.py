@@ -0,0 +1,84 @@
+import bisect
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+# Upper bounds, in seconds, of the connection wait-time histogram buckets.
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class PoolMetrics:
+    """How long callers wait for a pooled connection, as a histogram.
+
+    Bucket counts are cumulative, like a Prometheus histogram: each one
+    counts the checkouts that waited at most that many seconds. Checkouts
+    that gave up after the pool timeout are counted separately.
+    """
+
+    def __init__(self, buckets=WAIT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counts = [0] * (len(buckets) + 1)
+        self._total = 0.0
+        self._max = 0.0
+        self.timeouts = 0
+
+    def observe(self, seconds):
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self._total += seconds
+            self._max = max(self._max, seconds)
+
+    def timed_out(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool):
+        with self._lock:
+            counts, total, longest = list(self._counts), self._total, self._max
+        checkouts = sum(counts)
+        status = {"pool": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            status.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                idle=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+                timeout_seconds=pool.timeout(),
+            )
+        cumulative, buckets = 0, {}
+        for bound, count in zip(self.buckets, counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = checkouts
+        status["wait_seconds"] = {
+            "count": checkouts,
+            "sum": round(total, 6),
+            "max": round(longest, 6),
+            "mean": round(total / checkouts, 6) if checkouts else None,
+            "buckets": buckets,
+            "timeouts": self.timeouts,
+        }
+        return status
+
+
+def timed_pool_class(base, metrics):
+    """Subclass of pool class ``base`` that reports checkout waits to ``metrics``.
+
+    The subclass is made per engine so ``metrics`` survives the pool being
+    recreated, e.g. by ``engine.dispose()``.
+    """
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = base.connect(self)
+        except PoolTimeoutError:
+            metrics.timed_out()
+            raise
+        metrics.observe(time.perf_counter() - started)
+        return connection
+
+    return type(f"Timed{base.__name__}", (base,), {"connect": connect})
@@ -1,14 +1,18 @@
-import pickle
+import argparse
+import os
+import tempfile
 import warnings
 from collections import Counter
-from random import sample
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
-from sklearn.model_selection import train_test_split
+
+from app.flat_forest import compile_forest, save_flat_forest
+from app.training_data import FEATURE_NAMES, load_training_data
 
 warnings.filterwarnings("ignore")
 
@@ -28,18 +32,7 @@ class LoanApprovalModel:
         }
         for column, map_dict in mapping.items():
             loan_data[column] = loan_data[column].map(map_dict)
-        self.feature_names = [
-            " self_employed",
-            " income_annum",
-            " loan_amount",
-            " cibil_score",
-            " education",
-            " loan_term",
-            " residential_assets_value",
-            " commercial_assets_value",
-            " luxury_assets_value",
-            " bank_asset_value",
-        ]
+        self.feature_names = list(FEATURE_NAMES)
 
         X = loan_data[self.feature_names]
         y = loan_data[" loan_status"]
@@ -48,6 +41,9 @@ class LoanApprovalModel:
 
     def plot_distributions(self, loan_data):
         """Plot output distribution and correlation matrix."""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         plt.figure(figsize=(10, 5))
         sns.countplot(data=loan_data, x=" loan_status")
         plt.title("Loan Status Distribution")
@@ -59,13 +55,18 @@ class LoanApprovalModel:
         plt.tight_layout()
         plt.show()
 
-    def evaluate_model(self, y_true, y_pred):
+    def evaluate_model(self, y_true, y_pred, plot=True):
         """Evaluate model performance with multiple metrics."""
         print("\nModel Evaluation:")
         print("-" * 50)
         print(f"Accuracy: {accuracy_score(y_true, y_pred):.4f}")
         print("\nClassification Report:")
         print(classification_report(y_true, y_pred))
+        if not plot:
+            return
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         plt.figure(figsize=(8, 6))
         cm = confusion_matrix(y_true, y_pred)
         sns.heatmap(cm, annot=True, fmt="d", cmap="Blues")
@@ -76,42 +77,119 @@ class LoanApprovalModel:
 
 
 class DecisionTree:
-    def __init__(self, max_depth=None):
+    def __init__(
+        self,
+        max_depth=None,
+        max_features=None,
+        min_samples_split=2,
+        min_samples_leaf=1,
+        random_state=None,
+    ):
         self.max_depth = max_depth
+        self.max_features = max_features
+        self.min_samples_split = min_samples_split
+        self.min_samples_leaf = min_samples_leaf
+        self.random_state = random_state
         self.tree = None
 
     def fit(self, X, y):
-        self.tree = self._grow_tree(X, y, depth=0)
-
-    def _grow_tree(self, X, y, depth):
-        if len(set(y)) == 1 or (self.max_depth and depth >= self.max_depth):
-            return Counter(y).most_common(1)[0][0]
-        best_feature, best_threshold, best_gain, best_split = None, None, -1, None
-        for feature_index in range(len(X[0])):
-            thresholds = set([row[feature_index] for row in X])
-            for threshold in thresholds:
-                left_indices, right_indices = split_data(X, y, feature_index, threshold)
-                if left_indices and right_indices:
-                    gain = information_gain(y, left_indices, right_indices)
-                    if gain > best_gain:
-                        best_feature, best_threshold, best_gain, best_split = (
-                            feature_index,
-                            threshold,
-                            gain,
-                            (left_indices, right_indices),
+        """Grow the tree using per-feature presorted sample indices.
+
+        Every feature column is argsorted once at the root. Each node keeps
+        its samples in that order for every feature, so the best threshold
+        of a feature is found with a single cumulative class-count sweep
+        instead of re-splitting the data for every distinct value. One
+        sample mask is shared by all nodes; each node sets and clears only
+        its own samples, so routing stays proportional to the node size.
+        With ``max_features`` set, each node only searches a random subset
+        of the features, drawn from ``random_state``.
+        """
+        X = np.asarray(X)
+        classes, y_encoded = np.unique(np.asarray(y), return_inverse=True)
+        self.classes = classes.tolist()
+        self._start_feature_sampling(X.shape[1])
+        sorted_indices = [
+            np.argsort(X[:, feature_index], kind="stable")
+            for feature_index in range(X.shape[1])
+        ]
+        goes_left = np.zeros(len(X), dtype=bool)
+        self.tree = self._grow_tree(
+            X, y_encoded, np.arange(len(X)), sorted_indices, goes_left, depth=0
+        )
+
+    def _grow_tree(self, X, y, samples, sorted_indices, goes_left, depth):
+        y_node = y[samples]
+        class_counts = np.bincount(y_node, minlength=len(self.classes))
+        if self._is_leaf(class_counts, len(samples), depth):
+            return self._leaf_value(y_node, class_counts)
+        parent_impurity = gini_from_counts(class_counts)
+        best_feature, best_threshold, best_gain = None, None, -1
+        for feature_index in self._node_features():
+            order = sorted_indices[feature_index]
+            split = best_threshold_split(
+                X[order, feature_index],
+                y[order],
+                class_counts,
+                parent_impurity,
+                self.min_samples_leaf,
+            )
+            if split is None:
+                continue
+            thresholds, gain = split
+            if gain > best_gain:
+                if len(thresholds) > 1:
+                    thresholds = [
+                        first_in_set_order(
+                            thresholds, X[samples, feature_index].tolist()
                         )
+                    ]
+                best_feature, best_threshold, best_gain = (
+                    feature_index,
+                    thresholds[0],
+                    gain,
+                )
         if best_gain == -1:
-            return Counter(y).most_common(1)[0][0]
+            return self._leaf_value(y_node, class_counts)
 
-        left_indices, right_indices = best_split
+        goes_left[samples] = X[samples, best_feature] <= best_threshold
+        left_samples = samples[goes_left[samples]]
+        right_samples = samples[~goes_left[samples]]
+        left_sorted = [order[goes_left[order]] for order in sorted_indices]
+        right_sorted = [order[~goes_left[order]] for order in sorted_indices]
+        goes_left[samples] = False
         left_subtree = self._grow_tree(
-            [X[i] for i in left_indices], [y[i] for i in left_indices], depth + 1
+            X, y, left_samples, left_sorted, goes_left, depth + 1
         )
         right_subtree = self._grow_tree(
-            [X[i] for i in right_indices], [y[i] for i in right_indices], depth + 1
+            X, y, right_samples, right_sorted, goes_left, depth + 1
         )
         return (best_feature, best_threshold, left_subtree, right_subtree)
 
+    def _start_feature_sampling(self, n_features):
+        self._n_features = n_features
+        self._n_node_features = resolve_max_features(self.max_features, n_features)
+        self._rng = np.random.default_rng(self.random_state)
+
+    def _node_features(self):
+        """Indices of the features a node searches, in ascending order."""
+        if self._n_node_features == self._n_features:
+            return range(self._n_features)
+        return np.sort(
+            self._rng.choice(self._n_features, self._n_node_features, replace=False)
+        )
+
+    def _is_leaf(self, class_counts, n_samples, depth):
+        return (
+            np.count_nonzero(class_counts) == 1
+            or bool(self.max_depth and depth >= self.max_depth)
+            or n_samples < self.min_samples_split
+        )
+
+    def _leaf_value(self, y_node, class_counts):
+        """Majority class, ties going to the class seen first like Counter."""
+        is_majority = class_counts[y_node] == class_counts.max()
+        return self.classes[y_node[np.argmax(is_majority)]]
+
     def predict(self, X):
         return [self.predict_one(row, self.tree) for row in X]
 
@@ -124,23 +202,229 @@ class DecisionTree:
         return self.predict_one(row, right_subtree)
 
 
+class BinnedDecisionTree(DecisionTree):
+    """A tree grown on bin codes from per-node class histograms.
+
+    ``X`` holds the codes made by ``bin_features``, so a node's candidate
+    splits are the bin boundaries rather than every distinct value. Each
+    node's (feature, bin, class) histogram comes from its parent: only the
+    smaller child is counted from its rows, the larger one is the parent
+    minus that sibling. Thresholds are stored as the raw cut values, so the
+    fitted tree predicts on unbinned rows like any DecisionTree.
+    """
+
+    def __init__(self, bin_cuts=None, **tree_params):
+        super().__init__(**tree_params)
+        self.bin_cuts = bin_cuts
+
+    def fit(self, X, y):
+        codes = np.asarray(X)
+        classes, y_encoded = np.unique(np.asarray(y), return_inverse=True)
+        self.classes = classes.tolist()
+        self.n_bins = max(len(cuts) for cuts in self.bin_cuts) + 1
+        self._start_feature_sampling(codes.shape[1])
+        samples = np.arange(len(codes))
+        self.tree = self._grow_tree(
+            codes, y_encoded, samples, self._histogram(codes, y_encoded, samples), 0
+        )
+
+    def _histogram(self, codes, y, samples):
+        n_features, n_classes = codes.shape[1], len(self.classes)
+        cells = (
+            np.arange(n_features) * self.n_bins + codes[samples]
+        ) * n_classes + y[samples, np.newaxis]
+        return np.bincount(
+            cells.ravel(), minlength=n_features * self.n_bins * n_classes
+        ).reshape(n_features, self.n_bins, n_classes)
+
+    def _grow_tree(self, codes, y, samples, histogram, depth):
+        class_counts = histogram[0].sum(axis=0)
+        if self._is_leaf(class_counts, len(samples), depth):
+            return self.classes[int(np.argmax(class_counts))]
+        # Splitting after bin b sends codes <= b left.
+        left_counts = np.cumsum(histogram, axis=1)[:, :-1]
+        right_counts = class_counts - left_counts
+        n_left = left_counts.sum(axis=2)
+        n_right = len(samples) - n_left
+        is_valid = (n_left >= self.min_samples_leaf) & (
+            n_right >= self.min_samples_leaf
+        )
+        searched = np.zeros(len(is_valid), dtype=bool)
+        searched[self._node_features()] = True
+        is_valid[~searched] = False
+        if not is_valid.any():
+            return self.classes[int(np.argmax(class_counts))]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weighted_impurity = (
+                n_left * gini_from_counts(left_counts)
+                + n_right * gini_from_counts(right_counts)
+            ) / len(samples)
+        gains = np.where(
+            is_valid, gini_from_counts(class_counts) - weighted_impurity, -np.inf
+        )
+        feature, split_bin = np.unravel_index(np.argmax(gains), gains.shape)
+
+        goes_left = codes[samples, feature] <= split_bin
+        left_samples, right_samples = samples[goes_left], samples[~goes_left]
+        if len(left_samples) <= len(right_samples):
+            left_histogram = self._histogram(codes, y, left_samples)
+            right_histogram = histogram - left_histogram
+        else:
+            right_histogram = self._histogram(codes, y, right_samples)
+            left_histogram = histogram - right_histogram
+        return (
+            int(feature),
+            self.bin_cuts[feature][split_bin],
+            self._grow_tree(codes, y, left_samples, left_histogram, depth + 1),
+            self._grow_tree(codes, y, right_samples, right_histogram, depth + 1),
+        )
+
+
+def quantile_bin_cuts(X, max_bins):
+    """Per-feature cut values splitting each column into at most ``max_bins``.
+
+    Columns with few distinct values keep one bin per value, so binning
+    them loses nothing; the others are cut at quantiles. Cuts are always
+    values from the column.
+    """
+    cuts = []
+    for column in np.asarray(X, dtype=np.float64).T:
+        values = np.unique(column)
+        if len(values) > max_bins:
+            quantiles = np.linspace(0, 1, max_bins + 1)[1:-1]
+            values = np.unique(np.quantile(column, quantiles, method="lower"))
+        else:
+            values = values[:-1]
+        cuts.append(values.tolist())
+    return cuts
+
+
+def bin_features(X, bin_cuts):
+    """Bin codes of X: ``code <= b`` exactly when ``value <= bin_cuts[f][b]``."""
+    X = np.asarray(X, dtype=np.float64)
+    n_bins = max(len(cuts) for cuts in bin_cuts) + 1
+    codes = np.empty(X.shape, dtype=np.uint8 if n_bins <= 256 else np.uint16)
+    for feature_index, cuts in enumerate(bin_cuts):
+        codes[:, feature_index] = np.searchsorted(cuts, X[:, feature_index])
+    return codes
+
+
 class RandomForest:
-    def __init__(self, n_estimators=10, max_depth=None, max_features=None):
+    def __init__(
+        self,
+        n_estimators=10,
+        max_depth=None,
+        max_features=None,
+        n_jobs=None,
+        random_state=None,
+        binned=False,
+        max_bins=255,
+        min_samples_split=2,
+        min_samples_leaf=1,
+        oob_score=False,
+    ):
+        if binned and not 2 <= max_bins <= 65536:
+            raise ValueError(f"max_bins must be in [2, 65536], got {max_bins}")
         self.n_estimators = n_estimators
         self.max_depth = max_depth
         self.max_features = max_features
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        self.binned = binned
+        self.max_bins = max_bins
+        self.min_samples_split = min_samples_split
+        self.min_samples_leaf = min_samples_leaf
+        self.oob_score = oob_score
         self.trees = []
 
     def fit(self, X, y):
-        self.trees = []
-        n_samples = len(X)
-        for _ in range(self.n_estimators):
-            indices = sample(range(n_samples), n_samples)
-            X_bootstrap = [X[i] for i in indices]
-            y_bootstrap = [y[i] for i in indices]
-            tree = DecisionTree(max_depth=self.max_depth)
-            tree.fit(X_bootstrap, y_bootstrap)
-            self.trees.append(tree)
+        """Grow ``n_estimators`` bootstrap trees, optionally across processes.
+
+        Each tree draws its bootstrap rows from its own child of
+        ``SeedSequence(random_state)``, so the forest is the same whatever
+        ``n_jobs`` is. Worker processes memory-map one saved copy of the
+        training data instead of receiving X with every task. With
+        ``binned=True`` the features are quantized once into at most
+        ``max_bins`` bins and the trees are grown on the uint8/uint16 codes.
+        Per-node feature sampling continues from the same generator that
+        drew the tree's bootstrap rows. With ``oob_score=True`` the forest is
+        then scored on the rows each tree did not see, see ``_score_oob``.
+        """
+        X = np.asarray(X)
+        y = np.asarray(y)
+        self._grow_trees(X, y)
+        if self.oob_score:
+            self._score_oob(X, y)
+
+    def _grow_trees(self, X, y):
+        seeds = self._tree_seeds()
+        tree_params = {
+            "max_depth": self.max_depth,
+            "max_features": self.max_features,
+            "min_samples_split": self.min_samples_split,
+            "min_samples_leaf": self.min_samples_leaf,
+        }
+        if self.binned:
+            tree_params["bin_cuts"] = quantile_bin_cuts(X, self.max_bins)
+            X = bin_features(X, tree_params["bin_cuts"])
+        n_jobs = self._effective_n_jobs()
+        if n_jobs == 1:
+            self.trees = [
+                grow_bootstrap_tree(X, y, tree_params, seed) for seed in seeds
+            ]
+            return
+        with tempfile.TemporaryDirectory() as data_dir:
+            np.save(os.path.join(data_dir, "X.npy"), X)
+            np.save(os.path.join(data_dir, "y.npy"), y)
+            with ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=_load_training_data,
+                initargs=(data_dir,),
+            ) as executor:
+                self.trees = list(
+                    executor.map(partial(_grow_shared_tree, tree_params), seeds)
+                )
+
+    def _tree_seeds(self):
+        return np.random.SeedSequence(self.random_state).spawn(self.n_estimators)
+
+    def _score_oob(self, X, y):
+        """Out-of-bag accuracy and permutation importance of every feature.
+
+        The bootstrap rows of each tree are redrawn from its seed. A row is
+        predicted by majority vote of only the trees that never saw it, ties
+        going to the lowest class, and rows every tree saw are left out.
+        Sets ``oob_rows_`` and ``oob_prediction_`` for those rows,
+        ``oob_score_`` for their accuracy and ``oob_importances_``, the drop
+        in that accuracy when one feature column is shuffled.
+        """
+        forest = compile_forest(self)
+        in_bag = np.zeros((len(X), self.n_estimators), dtype=bool)
+        for tree_index, seed in enumerate(self._tree_seeds()):
+            rng = np.random.default_rng(seed)
+            in_bag[bootstrap_indices(rng, len(X)), tree_index] = True
+        self.oob_rows_ = np.flatnonzero(~in_bag.all(axis=1))
+        if not len(self.oob_rows_):
+            raise ValueError("Every row is in every bootstrap sample")
+        X, y = X[self.oob_rows_], y[self.oob_rows_]
+        out_of_bag = ~in_bag[self.oob_rows_]
+        self.oob_prediction_ = oob_vote(forest, X, out_of_bag)
+        self.oob_score_ = float(np.mean(self.oob_prediction_ == y))
+        rng = np.random.default_rng(self.random_state)
+        importances = []
+        for feature in range(X.shape[1]):
+            X_shuffled = X.copy()
+            X_shuffled[:, feature] = rng.permutation(X[:, feature])
+            shuffled_score = np.mean(oob_vote(forest, X_shuffled, out_of_bag) == y)
+            importances.append(self.oob_score_ - shuffled_score)
+        self.oob_importances_ = np.array(importances)
+
+    def _effective_n_jobs(self):
+        if not self.n_jobs:
+            return 1
+        if self.n_jobs < 0:
+            return max(1, (os.cpu_count() or 1) + 1 + self.n_jobs)
+        return self.n_jobs
 
     def predict(self, X):
         tree_predictions = [tree.predict(X) for tree in self.trees]
@@ -153,44 +437,150 @@ class RandomForest:
         return aggregated_predictions
 
 
-def split_data(X, y, feature_index, threshold):
-    """Split data based on feature threshold."""
-    left_indices = [i for i in range(len(X)) if X[i][feature_index] <= threshold]
-    right_indices = [i for i in range(len(X)) if X[i][feature_index] > threshold]
-    return left_indices, right_indices
+_training_data = {}
 
 
-def gini_impurity(y):
-    """Calculate Gini impurity."""
-    class_counts = Counter(y)
-    n_samples = len(y)
-    impurity = 1 - sum((count / n_samples) ** 2 for count in class_counts.values())
-    return impurity
+def _load_training_data(data_dir):
+    """Process pool initializer: memory-map the shared training arrays."""
+    _training_data["X"] = np.load(os.path.join(data_dir, "X.npy"), mmap_mode="r")
+    _training_data["y"] = np.load(os.path.join(data_dir, "y.npy"), mmap_mode="r")
 
 
-def information_gain(y, left_indices, right_indices):
-    """Calculate information gain."""
-    n_samples = len(y)
-    left_impurity = gini_impurity([y[i] for i in left_indices])
-    right_impurity = gini_impurity([y[i] for i in right_indices])
-    weighted_impurity = (len(left_indices) / n_samples) * left_impurity + (
-        len(right_indices) / n_samples
-    ) * right_impurity
-    return gini_impurity(y) - weighted_impurity
+def _grow_shared_tree(tree_params, seed):
+    return grow_bootstrap_tree(
+        _training_data["X"], _training_data["y"], tree_params, seed
+    )
+
+
+def bootstrap_indices(rng, n_rows):
+    return rng.integers(0, n_rows, size=n_rows)
+
+
+def grow_bootstrap_tree(X, y, tree_params, seed):
+    """Fit one DecisionTree on a bootstrap sample drawn from ``seed``."""
+    rng = np.random.default_rng(seed)
+    indices = bootstrap_indices(rng, len(X))
+    tree_class = BinnedDecisionTree if "bin_cuts" in tree_params else DecisionTree
+    tree = tree_class(**tree_params, random_state=rng)
+    tree.fit(X[indices], y[indices])
+    return tree
+
+
+def oob_vote(forest, X, out_of_bag):
+    """Majority class per row among the trees flagged in ``out_of_bag``."""
+    votes = forest.tree_votes(X)
+    counts = np.stack(
+        [
+            np.count_nonzero((votes == class_index) & out_of_bag, axis=1)
+            for class_index in range(len(forest.classes))
+        ],
+        axis=1,
+    )
+    return forest.classes[np.argmax(counts, axis=1)]
+
+
+def resolve_max_features(max_features, n_features):
+    """Number of features searched per node for a ``max_features`` setting.
+
+    None means all of them; "sqrt" and "log2" are taken of the feature
+    count, a float is a fraction of it and an int is used as is.
+    """
+    if max_features is None:
+        return n_features
+    if max_features == "sqrt":
+        return max(1, int(np.sqrt(n_features)))
+    if max_features == "log2":
+        return max(1, int(np.log2(n_features)))
+    if isinstance(max_features, float) and 0 < max_features <= 1:
+        return max(1, int(max_features * n_features))
+    if isinstance(max_features, int) and 1 <= max_features:
+        return min(max_features, n_features)
+    raise ValueError(
+        "max_features must be None, 'sqrt', 'log2', an int >= 1 or a float "
+        f"in (0, 1], got {max_features!r}"
+    )
+
+
+def gini_from_counts(class_counts):
+    """Calculate Gini impurity from per-class counts (rows are nodes)."""
+    class_counts = np.asarray(class_counts)
+    n_samples = class_counts.sum(axis=-1, keepdims=True)
+    return 1 - ((class_counts / n_samples) ** 2).sum(axis=-1)
+
+
+def best_threshold_split(
+    values, labels, class_counts, parent_impurity, min_samples_leaf=1
+):
+    """Find the best threshold of one presorted feature column.
+
+    Returns the candidate thresholds sharing the highest information gain
+    together with that gain, or None when the column is constant or no
+    split leaves ``min_samples_leaf`` samples on both sides.
+    """
+    n_samples = len(values)
+    boundaries = np.flatnonzero(values[:-1] != values[1:])
+    if min_samples_leaf > 1:
+        n_left = boundaries + 1
+        boundaries = boundaries[
+            (n_left >= min_samples_leaf) & (n_samples - n_left >= min_samples_leaf)
+        ]
+    if not len(boundaries):
+        return None
+    one_hot = np.eye(len(class_counts), dtype=np.int64)[labels]
+    left_counts = np.cumsum(one_hot, axis=0)[boundaries]
+    right_counts = class_counts - left_counts
+    n_left = boundaries + 1
+    n_right = n_samples - n_left
+    weighted_impurity = (n_left / n_samples) * gini_from_counts(left_counts) + (
+        n_right / n_samples
+    ) * gini_from_counts(right_counts)
+    gains = parent_impurity - weighted_impurity
+    best_gain = gains.max()
+    return values[boundaries[gains == best_gain]].tolist(), best_gain
+
+
+def first_in_set_order(thresholds, column_values):
+    """Pick the threshold a scan over ``set(column_values)`` would meet first."""
+    position = {value: rank for rank, value in enumerate(set(column_values))}
+    return min(thresholds, key=position.__getitem__)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Train and save the loan model.")
+    parser.add_argument(
+        "--no-plots",
+        action="store_true",
+        help="print the evaluation only; matplotlib and seaborn are not imported",
+    )
+    args = parser.parse_args()
+
     loan_model = LoanApprovalModel()
-    X, y = loan_model.load_and_preprocess_data("app/loan_approval_dataset.csv")
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42
+    X, y = load_training_data("app/loan_approval_dataset.csv")
+    model = RandomForest(
+        n_estimators=100, max_depth=10, n_jobs=-1, random_state=42, oob_score=True
+    )
+    model.fit(X, y)
+    loan_model.evaluate_model(
+        y[model.oob_rows_], model.oob_prediction_, plot=not args.no_plots
+    )
+    importances = dict(zip(FEATURE_NAMES, model.oob_importances_.round(4).tolist()))
+    print("\nOut-of-bag permutation importance:")
+    for name, importance in sorted(importances.items(), key=lambda item: -item[1]):
+        print(f"{name.strip():<26} {importance:.4f}")
+    save_flat_forest(
+        compile_forest(model),
+        "model.forest",
+        FEATURE_NAMES,
+        metadata={
+            "trained_at": datetime.now(timezone.utc).isoformat(),
+            "n_estimators": model.n_estimators,
+            "max_depth": model.max_depth,
+            "random_state": model.random_state,
+            "training_rows": len(X),
+            "oob_accuracy": round(model.oob_score_, 4),
+            "oob_importances": importances,
+        },
     )
-    model = RandomForest(n_estimators=100, max_depth=10)
-    model.fit(X_train.values.tolist(), y_train.values.tolist())
-    y_pred = model.predict(X_test.values.tolist())
-    loan_model.evaluate_model(y_test, y_pred)
-    with open("model.pkl", "wb") as file:
-        pickle.dump(model, file)
     print("\nModel saved successfully!")
 
 
@@ -5,7 +5,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.auth import create_access_token
+from app.auth import bank_cache, create_access_token
+from app.database import pool_status
+from app.load_model import prediction_cache, registry
+from app.routers.bank import get_admin
 
 router = APIRouter()
 
@@ -27,6 +30,26 @@ async def login(admin: OAuth2PasswordRequestForm = Depends()):
     return {"access_token": access_token, "token_type": "bearer"}
 
 
+@router.get("/admin/model")
+async def get_model_status(admin: str = Depends(get_admin)):
+    return registry.status()
+
+
+@router.get("/admin/prediction_cache")
+async def get_prediction_cache_stats(admin: str = Depends(get_admin)):
+    return prediction_cache.stats()
+
+
+@router.get("/admin/bank_cache")
+async def get_bank_cache_stats(admin: str = Depends(get_admin)):
+    return bank_cache.stats()
+
+
+@router.get("/admin/db_pool")
+async def get_db_pool_stats(admin: str = Depends(get_admin)):
+    return pool_status()
+
+
 @router.post("/logout")
 async def logout():
     response = JSONResponse(
@@ -1,32 +1,57 @@
-import base64
 import os
+import re
 from datetime import datetime, timedelta, timezone
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
-from fastapi.responses import JSONResponse
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Header,
+    HTTPException,
+    UploadFile,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.auth import (
+    bank_cache,
     create_access_token,
     get_current_user,
     get_password_hash,
     oauth2_scheme,
     verify_password,
 )
-from app.database import get_db
+from app.blob_store import blob_store
+from app.database import get_async_db
 from app.models import Bank, BankRegistrationDocument, Customer, LoanPackage
 
 router = APIRouter()
 
 ADMIN_USERNAME = os.getenv("ADMIN_USERNAME")
+# Documents are served inline only as these types; anything else is sent
+# as a plain download so an upload can never render as a page.
+DOCUMENT_TYPES = {"application/pdf", "image/jpeg", "image/png"}
 
 
 class BankActive(BaseModel):
     active: bool
 
 
+class BankSummary(BaseModel):
+    id: str
+    name: str
+    active: bool | None
+    activated_at: datetime | None
+
+
 def get_admin(token: str = Depends(oauth2_scheme)):
     admin = get_current_user(token)
     if not admin or admin != ADMIN_USERNAME:
@@ -42,36 +67,38 @@ async def register(
     name: str = Form(...),
     password: str = Form(...),
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    existing_bank_id = db.query(Bank).filter(Bank.id == id).first()
-    existing_bank_name = db.query(Bank).filter(Bank.name == name).first()
-    if existing_bank_id or existing_bank_name:
+    existing_bank = await db.scalar(
+        select(Bank.id).where(or_(Bank.id == id, Bank.name == name)).limit(1)
+    )
+    if existing_bank:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Bank with the given id or name already exists.",
         )
-    hashed_password = get_password_hash(password)
+    hashed_password = await get_password_hash(password)
+    sha256, size_bytes = await run_in_threadpool(blob_store.save, file.file)
     new_bank = Bank(id=id, name=name, hashed_password=hashed_password)
-    db.add(new_bank)
-    db.commit()
-    db.refresh(new_bank)
-    file_content = await file.read()
     new_document = BankRegistrationDocument(
-        filename=file.filename, file_content=file_content, bank_id=new_bank.id
+        filename=file.filename,
+        content_type=file.content_type,
+        size_bytes=size_bytes,
+        sha256=sha256,
+        bank_id=id,
     )
-    db.add(new_document)
-    db.commit()
-    db.refresh(new_document)
+    db.add_all([new_bank, new_document])
+    await db.commit()
     return {"message": "Bank registered successfully", "name": new_bank.name}
 
 
 @router.post("/login")
 async def login(
-    bank: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
+    bank: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    bank_record = db.query(Bank).filter(Bank.id == bank.username).first()
-    if not bank_record or not verify_password(
+    bank_record = await db.scalar(select(Bank).where(Bank.id == bank.username))
+    if not bank_record or not await verify_password(
         bank.password, bank_record.hashed_password
     ):
         raise HTTPException(
@@ -90,19 +117,25 @@ async def login(
     return {"access_token": access_token, "token_type": "bearer"}
 
 
-@router.get("/banks")
-async def get_all_banks(admin: str = Depends(get_admin), db: Session = Depends(get_db)):
-    banks = db.query(Bank).all()
-    return banks
+@router.get("/banks", response_model=list[BankSummary])
+async def get_all_banks(
+    admin: str = Depends(get_admin), db: AsyncSession = Depends(get_async_db)
+):
+    banks = await db.execute(
+        select(Bank.id, Bank.name, Bank.active, Bank.activated_at)
+    )
+    return banks.mappings().all()
 
 
 @router.get("/bank/{bank_id}")
 async def get_bank(
     bank_id: str,
     admin: str = Depends(get_admin),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    bank = db.query(Bank).filter(Bank.id == bank_id).first()
+    bank = await db.scalar(
+        select(Bank).where(Bank.id == bank_id).options(selectinload(Bank.proof_doc))
+    )
     if not bank:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -121,18 +154,94 @@ async def get_bank(
     proof_doc = bank.proof_doc
     proof_doc_data = None
     if proof_doc:
-        proof_doc_data = base64.b64encode(proof_doc.file_content).decode("utf-8")
+        proof_doc_data = {
+            "filename": proof_doc.filename,
+            "content_type": proof_doc.content_type,
+            "size_bytes": proof_doc.size_bytes,
+            "sha256": proof_doc.sha256,
+            "url": f"/bank/{bank_id}/document",
+        }
     return {"bank": bank_data, "proof_doc": proof_doc_data}
 
 
+def byte_range(range_header, size):
+    """``(start, end)`` of a single ``bytes=`` range, end inclusive.
+
+    Returns None when there is no usable Range header, so the whole file is
+    sent, and raises 416 for a range outside the file.
+    """
+    match = re.fullmatch(r"bytes=(\d*)-(\d*)", range_header or "")
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    else:
+        start, end = max(size - int(last), 0), size - 1
+    if start > end or start >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range is outside the document",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+@router.get("/bank/{bank_id}/document")
+async def get_bank_document(
+    bank_id: str,
+    range: str | None = Header(default=None),
+    admin: str = Depends(get_admin),
+    db: AsyncSession = Depends(get_async_db),
+):
+    document = await db.scalar(
+        select(BankRegistrationDocument).where(
+            BankRegistrationDocument.bank_id == bank_id
+        )
+    )
+    if not document or not blob_store.exists(document.sha256):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No document for bank with id {bank_id} found",
+        )
+    size = document.size_bytes
+    if document.content_type in DOCUMENT_TYPES:
+        media_type, disposition = document.content_type, "inline"
+    else:
+        media_type, disposition = "application/octet-stream", "attachment"
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": (
+            f"{disposition}; filename*=UTF-8''{quote(document.filename or bank_id)}"
+        ),
+        "ETag": f'"{document.sha256}"',
+        "X-Content-Type-Options": "nosniff",
+    }
+    requested = byte_range(range, size)
+    if requested is None:
+        start, end, status_code = 0, size - 1, status.HTTP_200_OK
+    else:
+        start, end = requested
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        blob_store.iter_range(document.sha256, start, end - start + 1),
+        status_code=status_code,
+        media_type=media_type,
+        headers=headers,
+    )
+
+
 @router.put("/bank/{bank_id}")
 async def update_bank(
     bank_id: str,
     bank_status: BankActive,
     admin: str = Depends(get_admin),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    bank = db.query(Bank).filter(Bank.id == bank_id).first()
+    bank = await db.scalar(select(Bank).where(Bank.id == bank_id))
     if not bank:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -140,8 +249,8 @@ async def update_bank(
         )
     bank.active = bank_status.active
     bank.activated_at = datetime.now(timezone.utc) if bank_status.active else None
-    db.commit()
-    db.refresh(bank)
+    await db.commit()
+    bank_cache.invalidate(bank_id)
     return {"message": "Bank activated successfully", "bank_id": bank_id}
 
 
@@ -149,23 +258,43 @@ async def update_bank(
 async def delete_bank(
     bank_id: str,
     admin: str = Depends(get_admin),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    existing_bank = db.query(Bank).filter(Bank.id == bank_id).first()
-    customers = db.query(Customer).filter(Customer.bank_id == bank_id).all()
-    loanpackages = db.query(LoanPackage).filter(LoanPackage.bank_id == bank_id).all()
+    existing_bank = await db.scalar(select(Bank.id).where(Bank.id == bank_id))
     if not existing_bank:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No customer with id {bank_id} found",
+            detail=f"No bank with id {bank_id} found",
+        )
+    document_hashes = (
+        await db.scalars(
+            select(BankRegistrationDocument.sha256).where(
+                BankRegistrationDocument.bank_id == bank_id
+            )
+        )
+    ).all()
+    deleted = {}
+    for name, model in (
+        ("customers", Customer),
+        ("loan_packages", LoanPackage),
+        ("documents", BankRegistrationDocument),
+    ):
+        result = await db.execute(delete(model).where(model.bank_id == bank_id))
+        deleted[name] = result.rowcount
+    await db.execute(delete(Bank).where(Bank.id == bank_id))
+    await db.commit()
+    bank_cache.invalidate(bank_id)
+    # Files cannot join the transaction, so blobs go only once the rows
+    # are gone, and only if no other bank uploaded the same content.
+    for sha256 in set(document_hashes):
+        still_used = await db.scalar(
+            select(BankRegistrationDocument.id)
+            .where(BankRegistrationDocument.sha256 == sha256)
+            .limit(1)
         )
-    for customer in customers:
-        db.delete(customer)
-    for package in loanpackages:
-        db.delete(package)
-    db.delete(existing_bank)
-    db.commit()
-    return {"message": "Bank deleted successfully", "bank_id": bank_id}
+        if not still_used:
+            blob_store.delete(sha256)
+    return {"message": "Bank deleted successfully", "bank_id": bank_id, **deleted}
 
 
 @router.post("/logout")
@@ -1,14 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+import csv
+import io
+import json
+import logging
+from datetime import datetime
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from sqlalchemy import case, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.auth import get_current_user, oauth2_scheme
-from app.database import get_db
-from app.load_model import predict_approval_status
-from app.loan_package_recommendation import loan_package_recommender
-from app.models import Bank, Customer, LoanPackage
+from app.auth import CurrentBank, bank_cache, get_current_user, oauth2_scheme
+from app.customer_import import iter_records, record_to_customer
+from app.database import AsyncSessionLocal, get_async_db, get_db
+from app.load_model import predict_approval_status, predict_approval_statuses
+from app.loan_package_recommendation import recommend_packages
+from app.models import Bank, Customer
+from app.pagination import keyset_page
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 1000
+APPROVAL_BATCH_LIMIT = 1000
+ID_LOOKUP_CHUNK = 500
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
 
 
 class CustomerBase(BaseModel):
@@ -30,31 +55,114 @@ class CustomerLoan(CustomerBase):
     loan_package: int | None = None
 
 
-def get_current_bank(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+class ApprovalBatch(BaseModel):
+    customers: list[CustomerBase] = Field(default=[], max_length=APPROVAL_BATCH_LIMIT)
+    customer_ids: list[int] = Field(default=[], max_length=APPROVAL_BATCH_LIMIT)
+
+
+async def get_current_bank(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)
 ):
     bank_id = get_current_user(token)
-    bank = db.query(Bank).filter(Bank.id == bank_id).first()
-    if not bank:
+    bank = bank_cache.get(bank_id)
+    if bank is None:
+        result = await db.execute(
+            select(Bank.id, Bank.name, Bank.active).where(Bank.id == bank_id)
+        )
+        bank_record = result.first()
+        if not bank_record:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid bank"
+            )
+        bank = CurrentBank(*bank_record)
+        bank_cache.put(bank_id, bank)
+    if not bank.active:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid bank"
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Your account is not activated.",
         )
     return bank
 
 
 @router.get("/customers")
 async def get_customers(
-    bank: Bank = Depends(get_current_bank), db: Session = Depends(get_db)
+    limit: int = Query(default=100, ge=1, le=1000),
+    after: int | None = None,
+    fields: str | None = None,
+    bank: CurrentBank = Depends(get_current_bank),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    customers = db.query(Customer).filter(Customer.bank_id == bank.id).all()
-    return {"customers": customers}
+    customers, next_cursor = await keyset_page(
+        db, Customer, [Customer.bank_id == bank.id], after, limit, fields
+    )
+    return {"customers": customers, "next_cursor": next_cursor}
+
+
+@router.get("/customers/export")
+async def export_customers(
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv)$"),
+    approval_status: bool | None = None,
+    updated_from: datetime | None = None,
+    updated_to: datetime | None = None,
+    bank: CurrentBank = Depends(get_current_bank),
+):
+    filters = [Customer.bank_id == bank.id]
+    if approval_status is not None:
+        filters.append(Customer.approval_status == approval_status)
+    if updated_from is not None:
+        filters.append(Customer.updated_at >= updated_from)
+    if updated_to is not None:
+        filters.append(Customer.updated_at <= updated_to)
+    return StreamingResponse(
+        stream_customers(filters, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f"attachment; filename=customers.{format}"
+        },
+    )
+
+
+async def stream_customers(filters, format):
+    """Yield the matching customers as NDJSON or CSV text chunks.
+
+    Rows are read through a server-side cursor ``EXPORT_BATCH_SIZE`` at a
+    time, so memory stays flat whatever the size of the bank. The session
+    is opened here because request dependencies are closed before a
+    streaming body is sent.
+    """
+    columns = list(Customer.__table__.columns)
+    names = [column.name for column in columns]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if format == "csv":
+        writer.writerow(names)
+    async with AsyncSessionLocal() as db:
+        rows = await db.stream(
+            select(*columns)
+            .where(*filters)
+            .order_by(Customer.id)
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        count = 0
+        async for row in rows:
+            count += 1
+            if format == "csv":
+                writer.writerow(row)
+            else:
+                buffer.write(json.dumps(dict(zip(names, row)), default=str))
+                buffer.write("\n")
+            if count % EXPORT_BATCH_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+    yield buffer.getvalue()
 
 
 @router.post("/customer")
 async def add_customer(
     customer: CustomerBase,
-    bank: Bank = Depends(get_current_bank),
-    db: Session = Depends(get_db),
+    bank: CurrentBank = Depends(get_current_bank),
+    db: AsyncSession = Depends(get_async_db),
 ):
     new_customer = Customer(
         name=customer.name,
@@ -72,21 +180,82 @@ async def add_customer(
         bank_id=bank.id,
     )
     db.add(new_customer)
-    db.commit()
-    db.refresh(new_customer)
+    await db.commit()
     return {"message": "Customer added successfully", "customer_id": new_customer.id}
 
 
+@router.post("/customers/import")
+def import_customers(
+    file: UploadFile = File(...),
+    format: str = Query(default="csv", pattern="^(ndjson|csv)$"),
+    batch_size: int = Query(default=1000, ge=1, le=10000),
+    score: bool = False,
+    bank: CurrentBank = Depends(get_current_bank),
+    db: Session = Depends(get_db),
+):
+    # A plain def on a sync session: parsing the upload and the bulk
+    # inserts are blocking work that belongs in the threadpool.
+    imported, errors, batch = 0, [], []
+
+    def insert_rows(rows):
+        # A batch that fails is split in half until the rows the database
+        # rejects are isolated, so one bad row does not sink the others.
+        try:
+            db.execute(
+                insert(Customer),
+                [dict(customer, bank_id=bank.id) for _, customer in rows],
+            )
+            db.commit()
+            return len(rows)
+        except Exception:
+            db.rollback()
+            if len(rows) == 1:
+                logger.exception(
+                    "Import of row %s for bank %s failed", rows[0][0], bank.id
+                )
+                errors.append({"row": rows[0][0], "detail": "Row could not be saved"})
+                return 0
+        middle = len(rows) // 2
+        return insert_rows(rows[:middle]) + insert_rows(rows[middle:])
+
+    def flush():
+        if score:
+            unscored = [row for row in batch if row[1]["approval_status"] is None]
+            if unscored:
+                statuses = predict_approval_statuses(
+                    [customer for _, customer in unscored], use_cache=False
+                )
+                for (_, customer), approval_status in zip(unscored, statuses):
+                    customer["approval_status"] = approval_status
+        return insert_rows(batch)
+
+    for row_number, record in iter_records(file.file, format):
+        try:
+            batch.append((row_number, record_to_customer(record, CustomerBase)))
+        except ValueError as exc:
+            errors.append({"row": row_number, "detail": str(exc)})
+        if len(batch) >= batch_size:
+            imported += flush()
+            batch = []
+    if batch:
+        imported += flush()
+    errors.sort(key=lambda error: error["row"])
+    return {
+        "message": "Customers imported",
+        "imported": imported,
+        "failed": len(errors),
+        "errors": errors,
+    }
+
+
 @router.get("/customer/{customer_id}")
 async def get_customer(
     customer_id: int,
-    bank: Bank = Depends(get_current_bank),
-    db: Session = Depends(get_db),
+    bank: CurrentBank = Depends(get_current_bank),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    customer = (
-        db.query(Customer)
-        .filter(Customer.id == customer_id, Customer.bank_id == bank.id)
-        .first()
+    customer = await db.scalar(
+        select(Customer).where(Customer.id == customer_id, Customer.bank_id == bank.id)
     )
     if not customer:
         raise HTTPException(
@@ -100,13 +269,11 @@ async def get_customer(
 async def update_customer(
     customer_id: int,
     customer: CustomerBase,
-    bank: Bank = Depends(get_current_bank),
-    db: Session = Depends(get_db),
+    bank: CurrentBank = Depends(get_current_bank),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    existing_customer = (
-        db.query(Customer)
-        .filter(Customer.id == customer_id, Customer.bank_id == bank.id)
-        .first()
+    existing_customer = await db.scalar(
+        select(Customer).where(Customer.id == customer_id, Customer.bank_id == bank.id)
     )
     if not existing_customer:
         raise HTTPException(
@@ -125,8 +292,7 @@ async def update_customer(
     existing_customer.loan_amount = customer.loan_amount
     existing_customer.loan_term = customer.loan_term
     existing_customer.approval_status = customer.approval_status
-    db.commit()
-    db.refresh(existing_customer)
+    await db.commit()
     return {"message": "Customer updated successfully", "customer_id": customer_id}
 
 
@@ -143,12 +309,74 @@ async def check_approval_status(
     return {"approval_status": approval_status, "message": message}
 
 
+@router.post("/check_approval_status/batch")
+async def check_approval_status_batch(
+    batch: ApprovalBatch,
+    bank: CurrentBank = Depends(get_current_bank),
+    db: AsyncSession = Depends(get_async_db),
+):
+    if batch.customers and batch.customer_ids:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Send either customers or customer_ids, not both.",
+        )
+    if batch.customer_ids:
+        unique_ids = list(dict.fromkeys(batch.customer_ids))
+        stored_customers = {}
+        for start in range(0, len(unique_ids), ID_LOOKUP_CHUNK):
+            chunk = unique_ids[start : start + ID_LOOKUP_CHUNK]
+            result = await db.scalars(
+                select(Customer).where(
+                    Customer.id.in_(chunk), Customer.bank_id == bank.id
+                )
+            )
+            stored_customers.update((customer.id, customer) for customer in result)
+        missing_ids = [
+            customer_id
+            for customer_id in batch.customer_ids
+            if customer_id not in stored_customers
+        ]
+        if missing_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No customers with ids {missing_ids} found",
+            )
+        customer_ids = batch.customer_ids
+        customers = [
+            CustomerBase.model_validate(
+                stored_customers[customer_id], from_attributes=True
+            ).model_dump()
+            for customer_id in customer_ids
+        ]
+    else:
+        customer_ids = [None] * len(batch.customers)
+        customers = [customer.model_dump() for customer in batch.customers]
+    approval_statuses = predict_approval_statuses(customers) if customers else []
+    results = []
+    for customer_id, customer, approval_status in zip(
+        customer_ids, customers, approval_statuses
+    ):
+        if approval_status:
+            message = f"Customer {customer['name']} is eligible for getting loan."
+        else:
+            message = f"Customer {customer['name']} is not eligible for getting loan."
+        results.append(
+            {
+                "customer_id": customer_id,
+                "approval_status": approval_status,
+                "message": message,
+            }
+        )
+    return {"results": results}
+
+
 @router.put("/recommend_loan_package/{customer_id}")
 async def recommend_loan_package(
     customer_id: int,
     customer: CustomerLoan,
-    bank: Bank = Depends(get_current_bank),
-    db: Session = Depends(get_db),
+    limit: int = Query(default=10, ge=1, le=100),
+    bank: CurrentBank = Depends(get_current_bank),
+    db: AsyncSession = Depends(get_async_db),
 ):
     customer_data = customer.model_dump()
     if not customer_data["approval_status"]:
@@ -156,48 +384,46 @@ async def recommend_loan_package(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=f"Customer with id {customer_id} is not eligible for getting loan!",
         )
-    packages = db.query(LoanPackage).filter(LoanPackage.bank_id == bank.id).all()
-    package_ids = loan_package_recommender(packages, customer_data)
-    return {"message": "Packages retrieved successfully", "packages": package_ids}
+    packages = await recommend_packages(db, bank.id, customer_data, limit)
+    return {"message": "Packages retrieved successfully", "packages": packages}
 
 
 @router.delete("/customer/{customer_id}")
 async def delete_customer(
     customer_id: int,
-    bank: Bank = Depends(get_current_bank),
-    db: Session = Depends(get_db),
+    bank: CurrentBank = Depends(get_current_bank),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    existing_customer = (
-        db.query(Customer)
-        .filter(Customer.id == customer_id, Customer.bank_id == bank.id)
-        .first()
+    existing_customer = await db.scalar(
+        select(Customer).where(Customer.id == customer_id, Customer.bank_id == bank.id)
     )
     if not existing_customer:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No customer with id {customer_id} found",
         )
-    db.delete(existing_customer)
-    db.commit()
+    await db.delete(existing_customer)
+    await db.commit()
     return {"message": "Customer deleted successfully", "customer_id": customer_id}
 
 
 @router.get("/customers/overview")
 async def get_customers_overview(
-    bank: Bank = Depends(get_current_bank), db: Session = Depends(get_db)
+    bank: CurrentBank = Depends(get_current_bank),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    total_customers = db.query(Customer).filter(Customer.bank_id == bank.id).count()
-    loan_approved_customers = (
-        db.query(Customer)
-        .filter(Customer.bank_id == bank.id, Customer.approval_status == True)
-        .count()
-    )
-    latest_customer = (
-        db.query(Customer)
-        .filter(Customer.bank_id == bank.id)
+    result = await db.execute(
+        select(
+            Customer.name,
+            func.count().over(),
+            func.sum(case((Customer.approval_status == True, 1), else_=0)).over(),
+        )
+        .where(Customer.bank_id == bank.id)
         .order_by(Customer.id.desc())
-        .first()
-    ).name
+        .limit(1)
+    )
+    overview = result.first()
+    latest_customer, total_customers, loan_approved_customers = overview or (None, 0, 0)
     return {
         "total_customers": total_customers,
         "loan_approved_customers": loan_approved_customers,
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.models import Bank, LoanPackage
+from app.auth import CurrentBank
+from app.database import get_async_db
+from app.models import LoanPackage
+from app.pagination import keyset_page
 from app.routers.customer import get_current_bank
 
 router = APIRouter()
@@ -21,17 +24,23 @@ class LoanPackageBase(BaseModel):
 
 @router.get("/loan_packages")
 async def get_packages(
-    bank: Bank = Depends(get_current_bank), db: Session = Depends(get_db)
+    limit: int = Query(default=100, ge=1, le=1000),
+    after: int | None = None,
+    fields: str | None = None,
+    bank: CurrentBank = Depends(get_current_bank),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    loan_packages = db.query(LoanPackage).filter(LoanPackage.bank_id == bank.id).all()
-    return {"packages": loan_packages}
+    loan_packages, next_cursor = await keyset_page(
+        db, LoanPackage, [LoanPackage.bank_id == bank.id], after, limit, fields
+    )
+    return {"packages": loan_packages, "next_cursor": next_cursor}
 
 
 @router.post("/loan_package")
 async def add_package(
     package: LoanPackageBase,
-    bank: Bank = Depends(get_current_bank),
-    db: Session = Depends(get_db),
+    bank: CurrentBank = Depends(get_current_bank),
+    db: AsyncSession = Depends(get_async_db),
 ):
     new_package = LoanPackage(
         loan_name=package.loan_name,
@@ -44,21 +53,20 @@ async def add_package(
         bank_id=bank.id,
     )
     db.add(new_package)
-    db.commit()
-    db.refresh(new_package)
+    await db.commit()
     return {"message": "Package added successfully", "package_id": new_package.id}
 
 
 @router.get("/loan_package/{package_id}")
 async def get_package(
     package_id: int,
-    bank: Bank = Depends(get_current_bank),
-    db: Session = Depends(get_db),
+    bank: CurrentBank = Depends(get_current_bank),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    package = (
-        db.query(LoanPackage)
-        .filter(LoanPackage.id == package_id, LoanPackage.bank_id == bank.id)
-        .first()
+    package = await db.scalar(
+        select(LoanPackage).where(
+            LoanPackage.id == package_id, LoanPackage.bank_id == bank.id
+        )
     )
     if not package:
         raise HTTPException(
@@ -72,13 +80,13 @@ async def get_package(
 async def update_package(
     package_id: int,
     package: LoanPackageBase,
-    bank: Bank = Depends(get_current_bank),
-    db: Session = Depends(get_db),
+    bank: CurrentBank = Depends(get_current_bank),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    existing_package = (
-        db.query(LoanPackage)
-        .filter(LoanPackage.id == package_id, LoanPackage.bank_id == bank.id)
-        .first()
+    existing_package = await db.scalar(
+        select(LoanPackage).where(
+            LoanPackage.id == package_id, LoanPackage.bank_id == bank.id
+        )
     )
     if not existing_package:
         raise HTTPException(
@@ -92,51 +100,51 @@ async def update_package(
     existing_package.min_credit_score = package.min_credit_score
     existing_package.interest_rate = package.interest_rate
     existing_package.loan_term = package.loan_term
-    db.commit()
-    db.refresh(existing_package)
+    await db.commit()
     return {"message": "Package updated successfully", "package_id": package_id}
 
 
 @router.delete("/loan_package/{package_id}")
 async def delete_customer(
     package_id: int,
-    bank: Bank = Depends(get_current_bank),
-    db: Session = Depends(get_db),
+    bank: CurrentBank = Depends(get_current_bank),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    existing_package = (
-        db.query(LoanPackage)
-        .filter(LoanPackage.id == package_id, LoanPackage.bank_id == bank.id)
-        .first()
+    existing_package = await db.scalar(
+        select(LoanPackage).where(
+            LoanPackage.id == package_id, LoanPackage.bank_id == bank.id
+        )
     )
     if not existing_package:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No package with id {package_id} found",
         )
-    db.delete(existing_package)
-    db.commit()
+    await db.delete(existing_package)
+    await db.commit()
     return {"message": "Package deleted successfully", "customer_id": package_id}
 
 
 @router.get("/packages/overview")
 async def get_packages_overview(
-    bank: Bank = Depends(get_current_bank), db: Session = Depends(get_db)
+    bank: CurrentBank = Depends(get_current_bank),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    total_packages = (
-        db.query(LoanPackage).filter(LoanPackage.bank_id == bank.id).count()
+    result = await db.execute(
+        select(
+            func.count().over(),
+            func.first_value(LoanPackage.loan_name).over(
+                order_by=(LoanPackage.loan_amount.desc(), LoanPackage.id)
+            ),
+            func.first_value(LoanPackage.loan_name).over(
+                order_by=(LoanPackage.loan_amount.asc(), LoanPackage.id)
+            ),
+        )
+        .where(LoanPackage.bank_id == bank.id)
+        .limit(1)
     )
-    max_loan = (
-        db.query(LoanPackage)
-        .filter(LoanPackage.bank_id == bank.id)
-        .order_by(LoanPackage.loan_amount.desc())
-        .first()
-    ).loan_name
-    min_loan = (
-        db.query(LoanPackage)
-        .filter(LoanPackage.bank_id == bank.id)
-        .order_by(LoanPackage.loan_amount.asc())
-        .first()
-    ).loan_name
+    overview = result.first()
+    total_packages, max_loan, min_loan = overview or (0, None, None)
     return {
         "total_packages": total_packages,
         "max_loan": max_loan,
@@ -15,48 +15,70 @@ function isAuthenticated() {
   return true;
 }
 
-// Load customer data when the page loads
-document.addEventListener("DOMContentLoaded", async () => {
-  if (!isAuthenticated()) {
-    window.location.href = "/static/login.html"; // Redirect to login if no token
-    return;
-  }
+let nextCursor = null;
 
-  try {
-    const response = await fetch(`${API_URL}/customers`, {
+// Fetch one page of customers and append it to the table
+async function loadPage() {
+  const customersTable = document.getElementById("customers-list");
+  const fields = "id,name,income,credit_score,loan_amount";
+  const loadMore = document.getElementById("load-more");
+  const query = nextCursor === null ? "" : `&after=${nextCursor}`;
+  const response = await fetch(
+    `${API_URL}/customers?fields=${fields}&limit=50${query}`,
+    {
       method: "GET",
       headers: {
         Authorization: `Bearer ${localStorage.getItem("token")}`,
       },
+    }
+  );
+
+  if (!response.ok) {
+    const errorData = await response.json();
+    document.getElementById("error-message").textContent =
+      errorData.detail || "Error fetching customers";
+    return;
+  }
+
+  const data = await response.json();
+  data.customers.forEach((customer) => {
+    const row = document.createElement("tr");
+    row.innerHTML = `
+      <td>${customer.name}</td>
+      <td>Rs ${customer.income}</td>
+      <td>${customer.credit_score}</td>
+      <td>Rs ${customer.loan_amount}</td>
+    `;
+    row.addEventListener("click", () => {
+      window.location.href = `/static/edit_customer.html?id=${customer.id}`;
     });
 
-    if (response.ok) {
-      const data = await response.json();
-      const customersList = data.customers;
-      const customersTable = document.getElementById("customers-list");
-
-      customersList.forEach((customer) => {
-        const row = document.createElement("tr");
-        row.innerHTML = `
-          <td>${customer.name}</td>
-          <td>Rs ${customer.income}</td>
-          <td>${customer.credit_score}</td>
-          <td>Rs ${customer.loan_amount}</td>
-        `;
-        row.addEventListener("click", () => {
-          window.location.href = `/static/edit_customer.html?id=${customer.id}`;
-        });
-
-        customersTable.appendChild(row);
-      });
-    } else {
-      const errorData = await response.json();
-      document.getElementById("error-message").textContent =
-        errorData.detail || "Error fetching customers";
-    }
+    customersTable.appendChild(row);
+  });
+  nextCursor = data.next_cursor;
+  loadMore.style.display = nextCursor === null ? "none" : "inline-block";
+}
+
+async function loadMoreClicked() {
+  const loadMore = document.getElementById("load-more");
+  loadMore.disabled = true;
+  try {
+    await loadPage();
   } catch (error) {
     console.error("Error:", error);
     document.getElementById("error-message").textContent =
       "An error occurred. Please try again.";
+  } finally {
+    loadMore.disabled = false;
+  }
+}
+
+// Load the first page of customers when the page loads
+document.addEventListener("DOMContentLoaded", async () => {
+  if (!isAuthenticated()) {
+    window.location.href = "/static/login.html"; // Redirect to login if no token
+    return;
   }
+
+  await loadMoreClicked();
 });
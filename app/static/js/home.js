@@ -30,7 +30,7 @@ async function fetchCustomerOverview() {
       document.getElementById("approved-customers").textContent =
         data.loan_approved_customers;
       document.getElementById("latest-customer").textContent =
-        data.latest_customer;
+        data.latest_customer ?? "-";
     }
   } catch (error) {
     console.error("Error:", error);
@@ -51,8 +51,8 @@ async function fetchPackageOverview() {
       const data = await response.json();
       document.getElementById("total-packages").textContent =
         data.total_packages;
-      document.getElementById("max-loan").textContent = data.max_loan;
-      document.getElementById("min-loan").textContent = data.min_loan;
+      document.getElementById("max-loan").textContent = data.max_loan ?? "-";
+      document.getElementById("min-loan").textContent = data.min_loan ?? "-";
     }
   } catch (error) {
     console.error("Error:", error);
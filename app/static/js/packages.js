@@ -15,48 +15,70 @@ function isAuthenticated() {
   return true;
 }
 
-// Load customer data when the page loads
-document.addEventListener("DOMContentLoaded", async () => {
-  if (!isAuthenticated()) {
-    window.location.href = "/static/login.html"; // Redirect to login if no token
-    return;
-  }
+let nextCursor = null;
 
-  try {
-    const response = await fetch(`${API_URL}/loan_packages`, {
+// Fetch one page of packages and append it to the table
+async function loadPage() {
+  const packageTable = document.getElementById("packages-list");
+  const fields = "id,loan_name,loan_amount,interest_rate,loan_term";
+  const loadMore = document.getElementById("load-more");
+  const query = nextCursor === null ? "" : `&after=${nextCursor}`;
+  const response = await fetch(
+    `${API_URL}/loan_packages?fields=${fields}&limit=50${query}`,
+    {
       method: "GET",
       headers: {
         Authorization: `Bearer ${localStorage.getItem("token")}`,
       },
+    }
+  );
+
+  if (!response.ok) {
+    const errorData = await response.json();
+    document.getElementById("error-message").textContent =
+      errorData.detail || "Error fetching packages";
+    return;
+  }
+
+  const data = await response.json();
+  data.packages.forEach((package) => {
+    const row = document.createElement("tr");
+    row.innerHTML = `
+      <td>${package.loan_name}</td>
+      <td>Rs ${package.loan_amount}</td>
+      <td>${package.interest_rate}%</td>
+      <td>${package.loan_term} months</td>
+    `;
+    row.addEventListener("click", () => {
+      window.location.href = `/static/edit_loan_package.html?id=${package.id}`;
     });
 
-    if (response.ok) {
-      const data = await response.json();
-      const packagesList = data.packages;
-      const packageTable = document.getElementById("packages-list");
-
-      packagesList.forEach((package) => {
-        const row = document.createElement("tr");
-        row.innerHTML = `
-          <td>${package.loan_name}</td>
-          <td>Rs ${package.loan_amount}</td>
-          <td>${package.interest_rate}%</td>
-          <td>${package.loan_term} months</td>
-        `;
-        row.addEventListener("click", () => {
-          window.location.href = `/static/edit_loan_package.html?id=${package.id}`;
-        });
-
-        packageTable.appendChild(row);
-      });
-    } else {
-      const errorData = await response.json();
-      document.getElementById("error-message").textContent =
-        errorData.detail || "Error fetching packages";
-    }
+    packageTable.appendChild(row);
+  });
+  nextCursor = data.next_cursor;
+  loadMore.style.display = nextCursor === null ? "none" : "inline-block";
+}
+
+async function loadMoreClicked() {
+  const loadMore = document.getElementById("load-more");
+  loadMore.disabled = true;
+  try {
+    await loadPage();
   } catch (error) {
     console.error("Error:", error);
     document.getElementById("error-message").textContent =
       "An error occurred. Please try again.";
+  } finally {
+    loadMore.disabled = false;
+  }
+}
+
+// Load the first page of packages when the page loads
+document.addEventListener("DOMContentLoaded", async () => {
+  if (!isAuthenticated()) {
+    window.location.href = "/static/login.html"; // Redirect to login if no token
+    return;
   }
+
+  await loadMoreClicked();
 });
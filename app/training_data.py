@@ -0,0 +1,163 @@
+import json
+import os
+from contextlib import ExitStack, suppress
+
+import numpy as np
+import pandas as pd
+
+# Column names and category labels keep the leading space they have in
+# loan_approval_dataset.csv; the feature names end up in the model header.
+FEATURE_NAMES = [
+    " self_employed",
+    " income_annum",
+    " loan_amount",
+    " cibil_score",
+    " education",
+    " loan_term",
+    " residential_assets_value",
+    " commercial_assets_value",
+    " luxury_assets_value",
+    " bank_asset_value",
+]
+TARGET_NAME = " loan_status"
+CATEGORY_CODES = {
+    " self_employed": {" No": False, " Yes": True},
+    " education": {" Not Graduate": False, " Graduate": True},
+    " loan_status": {" Rejected": False, " Approved": True},
+}
+COLUMN_DTYPES = {
+    name: np.dtype(bool) if name in CATEGORY_CODES else np.dtype(np.int32)
+    for name in FEATURE_NAMES + [TARGET_NAME]
+}
+CACHE_VERSION = 1
+READ_CHUNK_ROWS = 100_000
+INT32_RANGE = np.iinfo(np.int32)
+
+
+def default_cache_dir(csv_path):
+    return os.path.splitext(csv_path)[0] + ".columns"
+
+
+def build_column_cache(csv_path, cache_dir, chunksize=READ_CHUNK_ROWS):
+    """Stream ``csv_path`` into one .npy file per column under ``cache_dir``.
+
+    The CSV is parsed ``chunksize`` rows at a time. Categories are encoded
+    to bool and amounts narrowed to int32 chunk by chunk and appended to
+    raw column files, so memory use does not grow with the file. The
+    manifest is written last; a cache without one is rebuilt.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    manifest_path = os.path.join(cache_dir, "manifest.json")
+    with suppress(FileNotFoundError):
+        os.remove(manifest_path)
+    columns = FEATURE_NAMES + [TARGET_NAME]
+    n_rows = 0
+    with ExitStack() as stack:
+        part_files = {
+            name: stack.enter_context(
+                open(_column_path(cache_dir, name, ".part"), "wb")
+            )
+            for name in columns
+        }
+        chunks = pd.read_csv(
+            csv_path,
+            usecols=columns,
+            dtype={
+                name: str if name in CATEGORY_CODES else np.int64 for name in columns
+            },
+            chunksize=chunksize,
+        )
+        for chunk in chunks:
+            for name in columns:
+                values = encode_column(chunk[name], name, first_row=n_rows + 1)
+                part_files[name].write(values.tobytes())
+            n_rows += len(chunk)
+    if not n_rows:
+        raise ValueError(f"{csv_path} has no data rows")
+    for name in columns:
+        part_path = _column_path(cache_dir, name, ".part")
+        np.save(
+            _column_path(cache_dir, name, ".npy"),
+            np.memmap(part_path, dtype=COLUMN_DTYPES[name], mode="r"),
+        )
+        os.remove(part_path)
+    source = os.stat(csv_path)
+    with open(manifest_path, "w") as file:
+        json.dump(
+            {
+                "version": CACHE_VERSION,
+                "source_size": source.st_size,
+                "source_mtime_ns": source.st_mtime_ns,
+                "rows": n_rows,
+                "columns": {name: COLUMN_DTYPES[name].str for name in columns},
+            },
+            file,
+            indent=2,
+        )
+
+
+def encode_column(series, name, first_row):
+    """Convert one parsed CSV column chunk to its cached dtype."""
+    if name in CATEGORY_CODES:
+        codes = series.map(CATEGORY_CODES[name])
+        unknown = np.flatnonzero(codes.isna().to_numpy())
+        if len(unknown):
+            raise ValueError(
+                f"Unknown value {series.iloc[unknown[0]]!r} in column "
+                f"{name.strip()!r} at data row {first_row + unknown[0]}"
+            )
+        return codes.to_numpy(dtype=bool)
+    values = series.to_numpy()
+    out_of_range = np.flatnonzero(
+        (values < INT32_RANGE.min) | (values > INT32_RANGE.max)
+    )
+    if len(out_of_range):
+        raise ValueError(
+            f"Value {values[out_of_range[0]]} in column {name.strip()!r} at data "
+            f"row {first_row + out_of_range[0]} does not fit in int32"
+        )
+    return values.astype(np.int32)
+
+
+def cache_is_current(csv_path, cache_dir):
+    try:
+        with open(os.path.join(cache_dir, "manifest.json")) as file:
+            manifest = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+    source = os.stat(csv_path)
+    return (
+        manifest.get("version") == CACHE_VERSION
+        and manifest.get("source_size") == source.st_size
+        and manifest.get("source_mtime_ns") == source.st_mtime_ns
+    )
+
+
+def load_column_cache(cache_dir):
+    """Memory-map every cached column; returns ``{column name: array}``."""
+    return {
+        name: np.load(_column_path(cache_dir, name, ".npy"), mmap_mode="r")
+        for name in FEATURE_NAMES + [TARGET_NAME]
+    }
+
+
+def load_training_data(csv_path, cache_dir=None):
+    """Return ``(X, y)`` for training, parsing the CSV only when it changed.
+
+    X is an int32 matrix in ``FEATURE_NAMES`` order, with the two flags as
+    0/1, and y is int8 with 1 for approved. Every amount in the dataset is
+    a whole number, so int32 holds it exactly and the trees pick the same
+    thresholds they would on int64 or float64 columns.
+    """
+    cache_dir = cache_dir or default_cache_dir(csv_path)
+    if not cache_is_current(csv_path, cache_dir):
+        build_column_cache(csv_path, cache_dir)
+    columns = load_column_cache(cache_dir)
+    X = np.empty((len(columns[TARGET_NAME]), len(FEATURE_NAMES)), dtype=np.int32)
+    for index, name in enumerate(FEATURE_NAMES):
+        X[:, index] = columns[name]
+    return X, columns[TARGET_NAME].astype(np.int8)
+
+
+def _column_path(cache_dir, name, suffix):
+    return os.path.join(cache_dir, name.strip() + suffix)
@@ -0,0 +1,59 @@
+"""Training time and accuracy of exact vs histogram-binned forests.
+
+Run from the repository root:
+
+    python -m benchmarks.binned_training
+
+Every mode fits the same bootstrap seeds on an 80/20 split of
+``loan_approval_dataset.csv``. ``--repeat`` tiles the training rows to see
+how the modes scale with data size; the test rows are left as they are.
+"""
+
+import argparse
+import time
+
+import numpy as np
+from sklearn.model_selection import train_test_split
+
+from app.flat_forest import compile_forest
+from app.random_forest_model_trainer import LoanApprovalModel, RandomForest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default="app/loan_approval_dataset.csv")
+    parser.add_argument("--trees", type=int, default=20)
+    parser.add_argument("--max-depth", type=int, default=10)
+    parser.add_argument("--bins", default="255,64,16")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    X, y = LoanApprovalModel().load_and_preprocess_data(args.data)
+    X_train, X_test, y_train, y_test = train_test_split(
+        X.values, y.values, test_size=0.2, random_state=args.seed
+    )
+    X_train = np.tile(X_train, (args.repeat, 1))
+    y_train = np.tile(y_train, args.repeat)
+    modes = [("exact", {})] + [
+        (f"binned, {bins} bins", {"binned": True, "max_bins": bins})
+        for bins in map(int, args.bins.split(","))
+    ]
+    print(f"{len(X_train)} training rows, {args.trees} trees, depth {args.max_depth}")
+    print(f"{'mode':<20} {'fit s':>8} {'accuracy':>9}")
+    for name, options in modes:
+        model = RandomForest(
+            n_estimators=args.trees,
+            max_depth=args.max_depth,
+            random_state=args.seed,
+            **options,
+        )
+        started = time.perf_counter()
+        model.fit(X_train, y_train)
+        elapsed = time.perf_counter() - started
+        accuracy = np.mean(compile_forest(model).predict(X_test) == y_test)
+        print(f"{name:<20} {elapsed:>8.2f} {accuracy:>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Compare DecisionTree against the original per-threshold split search.
+
+Run from the repository root:
+
+    python -m benchmarks.decision_tree_split
+
+Every tree grown by both implementations is checked for equality, and the
+script exits with an error if any pair differs.
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+from app.random_forest_model_trainer import DecisionTree, LoanApprovalModel
+
+
+class ReferenceDecisionTree:
+    """The split search DecisionTree used before features were presorted."""
+
+    def __init__(self, max_depth=None):
+        self.max_depth = max_depth
+        self.tree = None
+
+    def fit(self, X, y):
+        self.tree = self._grow_tree(X, y, depth=0)
+
+    def _grow_tree(self, X, y, depth):
+        if len(set(y)) == 1 or (self.max_depth and depth >= self.max_depth):
+            return Counter(y).most_common(1)[0][0]
+        best_feature, best_threshold, best_gain, best_split = None, None, -1, None
+        for feature_index in range(len(X[0])):
+            thresholds = set([row[feature_index] for row in X])
+            for threshold in thresholds:
+                left_indices, right_indices = split_data(X, feature_index, threshold)
+                if left_indices and right_indices:
+                    gain = information_gain(y, left_indices, right_indices)
+                    if gain > best_gain:
+                        best_feature, best_threshold, best_gain, best_split = (
+                            feature_index,
+                            threshold,
+                            gain,
+                            (left_indices, right_indices),
+                        )
+        if best_gain == -1:
+            return Counter(y).most_common(1)[0][0]
+        left_indices, right_indices = best_split
+        left_subtree = self._grow_tree(
+            [X[i] for i in left_indices], [y[i] for i in left_indices], depth + 1
+        )
+        right_subtree = self._grow_tree(
+            [X[i] for i in right_indices], [y[i] for i in right_indices], depth + 1
+        )
+        return (best_feature, best_threshold, left_subtree, right_subtree)
+
+
+def split_data(X, feature_index, threshold):
+    left_indices = [i for i in range(len(X)) if X[i][feature_index] <= threshold]
+    right_indices = [i for i in range(len(X)) if X[i][feature_index] > threshold]
+    return left_indices, right_indices
+
+
+def gini_impurity(y):
+    class_counts = Counter(y)
+    n_samples = len(y)
+    return 1 - sum((count / n_samples) ** 2 for count in class_counts.values())
+
+
+def information_gain(y, left_indices, right_indices):
+    n_samples = len(y)
+    left_impurity = gini_impurity([y[i] for i in left_indices])
+    right_impurity = gini_impurity([y[i] for i in right_indices])
+    weighted_impurity = (len(left_indices) / n_samples) * left_impurity + (
+        len(right_indices) / n_samples
+    ) * right_impurity
+    return gini_impurity(y) - weighted_impurity
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default="app/loan_approval_dataset.csv")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--trees", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    X, y = LoanApprovalModel().load_and_preprocess_data(args.data)
+    X, y = X.values.tolist(), y.values.tolist()
+    rng = np.random.default_rng(args.seed)
+    mismatches = 0
+    print(f"{'case':>4} {'depth':>5} {'noise':>5} {'reference':>10} {'presorted':>10}")
+    for case in range(args.trees):
+        max_depth = 10 if case % 2 else None
+        noise = 0.2 if case % 3 == 2 else 0.0
+        indices = rng.integers(0, len(X), size=args.rows)
+        X_sample = [X[i] for i in indices]
+        y_sample = [1 - y[i] if rng.random() < noise else y[i] for i in indices]
+        timings = []
+        trees = []
+        for tree_class in (ReferenceDecisionTree, DecisionTree):
+            tree = tree_class(max_depth=max_depth)
+            started = time.perf_counter()
+            tree.fit(X_sample, y_sample)
+            timings.append(time.perf_counter() - started)
+            trees.append(tree.tree)
+        mismatches += trees[0] != trees[1]
+        print(
+            f"{case:>4} {str(max_depth):>5} {noise:>5} "
+            f"{timings[0]:>9.3f}s {timings[1]:>9.3f}s"
+            + ("" if trees[0] == trees[1] else "  TREES DIFFER")
+        )
+    if mismatches:
+        sys.exit(f"{mismatches} tree(s) differ from the reference implementation")
+    print("All trees match the reference implementation.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Requests/sec of a running API at increasing client concurrency.
+
+Start the app, then from the repository root:
+
+    python -m benchmarks.load_test --username <bank id> --password <password>
+
+Each level runs ``--duration`` seconds of closed-loop clients that cycle
+through the ``--path`` endpoints with the bank's token. A request that does
+not answer within ``--timeout`` seconds counts as an error, so a server
+that stalls under load shows up as errors rather than as a hung script.
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+
+async def client_loop(client, paths, deadline, timings, errors):
+    index = 0
+    while time.perf_counter() < deadline:
+        path = paths[index % len(paths)]
+        index += 1
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            errors.append(path)
+            continue
+        timings.append(time.perf_counter() - started)
+
+
+async def run_level(args, token, clients):
+    timings, errors = [], []
+    async with httpx.AsyncClient(
+        base_url=args.url,
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=args.timeout,
+        limits=httpx.Limits(max_connections=clients),
+    ) as client:
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(
+                client_loop(client, args.path, deadline, timings, errors)
+                for _ in range(clients)
+            )
+        )
+        elapsed = time.perf_counter() - started
+    timings.sort()
+    p50 = timings[len(timings) // 2] if timings else float("nan")
+    p99 = timings[int(len(timings) * 0.99)] if timings else float("nan")
+    print(
+        f"{clients:>7} {len(timings) / elapsed:>9.1f} {p50 * 1e3:>9.1f} "
+        f"{p99 * 1e3:>9.1f} {len(errors):>7}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument(
+        "--path",
+        action="append",
+        help="endpoint to request; repeat to cycle through several",
+    )
+    parser.add_argument("--clients", default="1,16,64")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+    args.path = args.path or ["/customers?limit=50", "/customers/overview"]
+
+    async with httpx.AsyncClient(base_url=args.url) as client:
+        response = await client.post(
+            "/login", data={"username": args.username, "password": args.password}
+        )
+        response.raise_for_status()
+        token = response.json()["access_token"]
+
+    print(f"{'clients':>7} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for clients in [int(level) for level in args.clients.split(",")]:
+        await run_level(args, token, clients)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""Latency of unrelated endpoints while bank logins hammer bcrypt.
+
+Start the app, then from the repository root:
+
+    python -m benchmarks.login_storm --username <bank id> --password <password>
+
+The probe clients request ``--probe-path`` twice: first on a quiet server,
+then while ``--logins`` clients post to /login in a loop. Compare the probe
+p99 of the two phases to see how much password hashing holds up the rest
+of the worker.
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+
+def percentile(timings, fraction):
+    if not timings:
+        return float("nan")
+    timings = sorted(timings)
+    return timings[min(len(timings) - 1, int(len(timings) * fraction))]
+
+
+async def probe_loop(client, path, deadline, timings):
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        timings.append(time.perf_counter() - started)
+
+
+async def login_loop(client, credentials, deadline, outcomes):
+    while time.perf_counter() < deadline:
+        response = await client.post("/login", data=credentials)
+        outcomes.append(response.status_code)
+
+
+async def run_phase(args, client, credentials, logins):
+    probe_timings, login_outcomes = [], []
+    deadline = time.perf_counter() + args.duration
+    await asyncio.gather(
+        *(
+            probe_loop(client, args.probe_path, deadline, probe_timings)
+            for _ in range(args.probes)
+        ),
+        *(
+            login_loop(client, credentials, deadline, login_outcomes)
+            for _ in range(logins)
+        ),
+    )
+    print(
+        f"{logins:>7} {len(probe_timings):>7} "
+        f"{percentile(probe_timings, 0.5) * 1e3:>9.1f} "
+        f"{percentile(probe_timings, 0.99) * 1e3:>9.1f} "
+        f"{login_outcomes.count(200) / args.duration:>9.1f} "
+        f"{login_outcomes.count(503):>7}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--probe-path", default="/customers?limit=10")
+    parser.add_argument("--probes", type=int, default=4)
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10)
+    args = parser.parse_args()
+    credentials = {"username": args.username, "password": args.password}
+
+    async with httpx.AsyncClient(base_url=args.url, timeout=60) as client:
+        response = await client.post("/login", data=credentials)
+        response.raise_for_status()
+        client.headers["Authorization"] = (
+            f"Bearer {response.json()['access_token']}"
+        )
+        print(
+            f"{'logins':>7} {'probes':>7} {'p50 ms':>9} {'p99 ms':>9} "
+            f"{'login/s':>9} {'503s':>7}"
+        )
+        await run_phase(args, client, credentials, 0)
+        await run_phase(args, client, credentials, args.logins)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,83 @@
+"""Per-call approval scoring latency: DataFrame input vs NumPy feature rows.
+
+Run from the repository root:
+
+    python -m benchmarks.predict_latency
+
+The reference path builds a one-row DataFrame with the trained column names,
+as predict_approval_status did before. The script checks both paths agree
+on every customer it scores.
+"""
+
+import argparse
+import pickle
+import sys
+import time
+
+import pandas as pd
+
+from app.customer_import import CATEGORY_VALUES, DATASET_FIELDS
+from app.load_model import FEATURE_FIELDS, build_feature_matrix, load_model_file
+
+
+def dataframe_predict(model, customer):
+    input_data = {
+        column: [customer[field]] for column, field in FEATURE_FIELDS.items()
+    }
+    return bool(model.predict(pd.DataFrame(input_data))[0])
+
+
+def array_predict(model, customer):
+    return bool(model.predict(build_feature_matrix([customer]))[0])
+
+
+def load_customers(path, rows):
+    loan_data = pd.read_csv(path, nrows=rows)
+    loan_data.columns = loan_data.columns.str.strip()
+    customers = []
+    for record in loan_data.to_dict("records"):
+        for column, values in CATEGORY_VALUES.items():
+            record[column] = values[record[column].strip()]
+        customers.append(
+            {field: record[column] for column, field in DATASET_FIELDS.items()}
+        )
+    return customers
+
+
+def latency(predict, model, customers):
+    timings = []
+    predictions = []
+    for customer in customers:
+        started = time.perf_counter()
+        predictions.append(predict(model, customer))
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    median = timings[len(timings) // 2]
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    return predictions, median, p99
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="app/random_forest_model.pkl")
+    parser.add_argument("--data", default="app/loan_approval_dataset.csv")
+    parser.add_argument("--rows", type=int, default=300)
+    args = parser.parse_args()
+
+    customers = load_customers(args.data, args.rows)
+    with open(args.model, "rb") as file:
+        reference_model = pickle.load(file)
+    serving_model = load_model_file(args.model).model
+    before, before_median, before_p99 = latency(
+        dataframe_predict, reference_model, customers
+    )
+    after, after_median, after_p99 = latency(array_predict, serving_model, customers)
+    print(f"DataFrame: median {before_median * 1e3:.2f}ms p99 {before_p99 * 1e3:.2f}ms")
+    print(f"NumPy:     median {after_median * 1e3:.2f}ms p99 {after_p99 * 1e3:.2f}ms")
+    if before != after:
+        sys.exit("Predictions differ between the DataFrame and NumPy paths")
+    print(f"Predictions match on all {len(customers)} customers.")
+
+
+if __name__ == "__main__":
+    main()